@@ -0,0 +1,103 @@
+"""
+Shared pytest fixtures for the Traffic Simulation tests.
+
+The flow networks are built once per session as immutable tuples; the
+function-scoped fixtures hand each test its own mutable list copy.
+database.py is only imported by the tests that ask for the `db` fixture,
+which points it at a per-session temporary database, and verification
+queries share one cached connection (`db_conn`).
+"""
+
+import sqlite3
+
+import pytest
+
+
+# ============================================================================
+# FLOW NETWORK FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def sample_graph_proto():
+    """Immutable sample graph shared by the whole session"""
+    nodes = ("A", "B", "C", "D")
+    edges = (("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"))
+    edge_caps = (
+        (("A", "B"), 10),
+        (("A", "C"), 5),
+        (("B", "D"), 8),
+        (("C", "D"), 7)
+    )
+    capacity_matrix = (
+        (0, 10, 5, 0),   # A
+        (0, 0, 0, 8),    # B
+        (0, 0, 0, 7),    # C
+        (0, 0, 0, 0)     # D
+    )
+    return nodes, edges, edge_caps, capacity_matrix
+
+
+@pytest.fixture
+def sample_graph(sample_graph_proto):
+    """Provide a sample graph for testing"""
+    nodes, edges, edge_caps, capacity_matrix = sample_graph_proto
+    return list(nodes), list(edges), dict(edge_caps), [list(row) for row in capacity_matrix]
+
+
+@pytest.fixture(scope="session")
+def simple_network_proto():
+    """Immutable simple network shared by the whole session"""
+    # Simple network: A -> B -> C with capacities
+    return (
+        (0, 10, 0),  # A
+        (0, 0, 15),  # B
+        (0, 0, 0)    # C
+    )
+
+
+@pytest.fixture
+def simple_network(simple_network_proto):
+    """Provide a simple flow network for testing"""
+    return [list(row) for row in simple_network_proto]
+
+
+# ============================================================================
+# DATABASE FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def db(tmp_path_factory):
+    """database module, imported on first use rather than at collection.
+
+    For the session it writes to a fresh temporary file instead of the
+    game's own database, so concurrent sessions (e.g. pytest-xdist workers)
+    never share one. Its connections also skip fsync: durability is
+    irrelevant for test rows, and the per-commit sync dominates the insert
+    tests.
+    """
+    import database
+
+    connect = database._connect
+    db_path = str(tmp_path_factory.mktemp("db") / "traffic_simulations.db")
+
+    def fast_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, "DB_PATH", db_path)
+        mp.setattr(database, "_connect", fast_connect)
+        yield database
+
+
+@pytest.fixture(scope="session")
+def db_conn(db):
+    """One connection to DB_PATH reused by every verification query"""
+    db.init_db()
+    conn = sqlite3.connect(db.DB_PATH)
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    yield conn
+    conn.close()
@@ -13,11 +13,15 @@ class DatabaseError(Exception):
     """Custom exception for database operations"""
     pass
 
+def _connect(timeout=5.0):
+    """Open a connection to DB_PATH (single place to tune connection settings)"""
+    return sqlite3.connect(DB_PATH, timeout=timeout)
+
 def init_db():
     """Initialize the database without wiping existing game history."""
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = _connect()
         cur = conn.cursor()
 
         # Create tables if they do not exist. Do NOT drop existing data.
@@ -61,7 +65,7 @@ def clear_db():
     """Clear all data from database tables"""
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = _connect()
         cur = conn.cursor()
         
         cur.execute("DELETE FROM win_results")
@@ -164,7 +168,7 @@ def insert_correct_result(player_name, player_guess, correct_answer, ek_time, di
     
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH, timeout=10)
+        conn = _connect(timeout=10)
         cur = conn.cursor()
         
         # Get next ID
@@ -248,7 +252,7 @@ def insert_all_result(player_name, player_guess, correct_answer, ek_time, dinic_
     
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH, timeout=10)
+        conn = _connect(timeout=10)
         cur = conn.cursor()
         
         # Get next ID
@@ -1,15 +1,19 @@
 # graph.py
 # Build the traffic network as an edge-capacity map and a nodes list.
 # This module returns:
-# - NODES (list)
-# - EDGES (list of pairs)
+# - NODES (tuple)
+# - EDGES (tuple of pairs)
 # - edge_caps dict {(u,v): cap}
 # - capacity_matrix (adjacency matrix)
+# - node_index read-only mapping {node: matrix index}
 
 import random
+from types import MappingProxyType
 
-NODES = ["A","B","C","D","E","F","G","H","T"]
-EDGES = [
+# Fixed network: tuples so the constants can't be mutated by callers and
+# the edge pairs can be reused directly as edge_caps keys
+NODES = ("A","B","C","D","E","F","G","H","T")
+EDGES = (
     ("A","B"), ("A","C"), ("A","D"),
     ("B","E"), ("B","F"),
     ("C","E"), ("C","F"),
@@ -17,26 +21,27 @@ EDGES = [
     ("E","G"), ("E","H"),
     ("F","H"),
     ("G","T"), ("H","T")
-]
+)
+
+# node -> matrix index; NODES never changes so this is built once
+# (also serves as the O(1) membership test for node names). It is handed
+# to every caller of new_random_graph, so it is a read-only view
+NODE_INDEX = MappingProxyType({name: i for i, name in enumerate(NODES)})
 
 def generate_edge_caps(min_cap=5, max_cap=15):
-    edge_caps = {}
-    for (u,v) in EDGES:
-        edge_caps[(u,v)] = random.randint(min_cap, max_cap)
-    return edge_caps
+    return {edge: random.randint(min_cap, max_cap) for edge in EDGES}
 
 def generate_capacity_matrix(nodes_list, edge_caps):
     n = len(nodes_list)
-    idx = {nodes_list[i]: i for i in range(n)}
+    # node -> index map built once, so each edge is an O(1) lookup
+    idx = dict(zip(nodes_list, range(n)))
     mat = [[0]*n for _ in range(n)]
     for (u,v), cap in edge_caps.items():
-        ui = idx[u]
-        vi = idx[v]
-        mat[ui][vi] = cap
+        mat[idx[u]][idx[v]] = cap
     return mat
 
 # convenience function used by UI/main to get all artifacts
 def new_random_graph():
     edge_caps = generate_edge_caps()
     capacity_mat = generate_capacity_matrix(NODES, edge_caps)
-    return NODES, EDGES, edge_caps, capacity_mat
+    return NODES, EDGES, edge_caps, capacity_mat, NODE_INDEX
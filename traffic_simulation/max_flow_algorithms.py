@@ -2,76 +2,91 @@
 # Pure Python implementations: Edmonds-Karp (BFS) and Dinic's Algorithm (level graph + blocking flow)
 # No external imports required beyond built-ins.
 
+from collections import deque
+
 # -------------------------
-# Helper: Simple Queue (list-based)
+# Helper: Simple Queue (deque-based, O(1) enqueue/dequeue)
 # -------------------------
 
 
 class SimpleQueue:
+    __slots__ = ("_data",)
+
     def __init__(self):
-        self._data = []
+        self._data = deque()
     def enqueue(self, x):
         self._data.append(x)
     def dequeue(self):
         if self._data:
-            return self._data.pop(0)
+            return self._data.popleft()
         return None
     def is_empty(self):
-        return len(self._data) == 0
+        return not self._data
 
 # -------------------------
 # Edmonds-Karp (BFS-based Ford-Fulkerson)
 # Uses adjacency matrix 'capacity' and integer node indices
 # -------------------------
-def edmonds_karp(capacity, source, sink):
-    n = len(capacity)
-    # residual is a copy of capacity
-    residual = [capacity[i][:] for i in range(n)]
-
+def _edmonds_karp_core(residual, n, source, sink):
+    """Run Edmonds-Karp on 'residual' (modified in place) and return the max flow."""
+    # residual neighbours of u: any v joined to u by an edge in either
+    # direction (reverse edges gain capacity once flow is pushed), built once
+    # so BFS scans the real edges instead of a whole matrix row
+    adj = [[v for v in range(n) if residual[u][v] > 0 or residual[v][u] > 0]
+           for u in range(n)]
     parent = [-1] * n
+    # every node is enqueued at most once per BFS, so a fixed array with
+    # head/tail indices replaces SimpleQueue and its per-call method overhead
+    queue = [0] * n
 
-    def bfs():
-        # returns True if there's a path, fills parent[]
+    max_flow = 0
+    while True:
+        # BFS: fills parent[] and stops as soon as the sink is reached
         for i in range(n):
             parent[i] = -1
-        q = SimpleQueue()
-        q.enqueue(source)
         parent[source] = -2  # mark source visited with special value
-        while not q.is_empty():
-            u = q.dequeue()
-            for v in range(n):
-                if parent[v] == -1 and residual[u][v] > 0:
+        queue[0] = source
+        head, tail = 0, 1
+        found = False
+        while head < tail and not found:
+            u = queue[head]
+            head += 1
+            row = residual[u]
+            for v in adj[u]:
+                if parent[v] == -1 and row[v] > 0:
                     parent[v] = u
                     if v == sink:
-                        return True
-                    q.enqueue(v)
-        return False
-
-    max_flow = 0
-    while bfs():
-        # find bottleneck
-        path_flow = 10**18
-        s = sink
-        while s != source:
-            u = parent[s]
-            if u == -1:
-                break
-            if residual[u][s] < path_flow:
-                path_flow = residual[u][s]
-            s = u
-        if path_flow == 10**18:
+                        found = True
+                        break
+                    queue[tail] = v
+                    tail += 1
+        if not found:
             break
-        # update residual
+
+        # walk parent[] once; the bottleneck and the update both reuse the path
+        path = []
         v = sink
         while v != source:
             u = parent[v]
+            path.append((u, v))
+            v = u
+        path_flow = min(residual[u][v] for u, v in path)
+
+        # update residual
+        for u, v in path:
             residual[u][v] -= path_flow
             residual[v][u] += path_flow
-            v = u
         max_flow += path_flow
 
     return max_flow
 
+
+def edmonds_karp(capacity, source, sink):
+    n = len(capacity)
+    # residual is a copy of capacity
+    residual = [capacity[i][:] for i in range(n)]
+    return _edmonds_karp_core(residual, n, source, sink)
+
 # -------------------------
 # Dinic's Algorithm
 # Uses adjacency matrix 'capacity' and integer node indices
@@ -83,15 +98,20 @@ def dinic(capacity, source, sink):
     def bfs_level():
         """Build level graph; return list of levels (sink level -1 if unreachable)."""
         level = [-1] * n
-        q = SimpleQueue()
-        q.enqueue(source)
+        queue = [0] * n  # fixed array queue, each node enters at most once
+        queue[0] = source
+        head, tail = 0, 1
         level[source] = 0
-        while not q.is_empty():
-            u = q.dequeue()
+        while head < tail:
+            u = queue[head]
+            head += 1
+            row = residual[u]
+            next_level = level[u] + 1
             for v in range(n):
-                if residual[u][v] > 0 and level[v] == -1:
-                    level[v] = level[u] + 1
-                    q.enqueue(v)
+                if row[v] > 0 and level[v] == -1:
+                    level[v] = next_level
+                    queue[tail] = v
+                    tail += 1
         return level
 
     def dfs_block(u, pushed, level, it):
@@ -408,11 +408,11 @@ class TrafficGameUI:
         """Generate a new round with exception handling"""
         try:
             # generate graph
-            self.nodes, self.edges, self.edge_caps, self.capacity_mat = new_random_graph()
+            self.nodes, self.edges, self.edge_caps, self.capacity_mat, self.node_index = new_random_graph()
             # Convert to matrix is already returned, but ensure compatible with algorithm helper
             # compute correct flows using both algorithms (matrix + indices)
-            source_idx = self.nodes.index("A")
-            sink_idx = self.nodes.index("T")
+            source_idx = self.node_index["A"]
+            sink_idx = self.node_index["T"]
 
             self.correct_answer, ek_time = time_function(edmonds_karp, self.capacity_mat, source_idx, sink_idx)
             # Dinic also mutates the matrix; operate on a copy for fairness
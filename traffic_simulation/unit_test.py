@@ -9,28 +9,24 @@ import pytest
 import sqlite3
 import os
 import sys
-import tempfile
 import shutil
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 # Import modules to test
-import sys
-import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from database import (
-    init_db, clear_db, validate_player_name, validate_answer,
-    insert_correct_result, insert_all_result, DatabaseError
-)
+# database.py is not imported here: tests that need it take the session
+# scoped `db` fixture (conftest.py), so collection and the pure algorithm
+# tests never import it or run its logging setup
 from graph import (
-    NODES, EDGES, generate_edge_caps, generate_capacity_matrix,
+    NODES, EDGES, NODE_INDEX, generate_edge_caps, generate_capacity_matrix,
     new_random_graph
 )
 from max_flow_algorithms import (
     SimpleQueue, edmonds_karp, dinic
 )
-from utils import validate_int, time_function
+from utils import validate_int, time_function, time_function_repeat
 
 
 # ============================================================================
@@ -63,38 +59,6 @@ def temp_db():
         shutil.move(f"{original_db}.backup", original_db)
 
 
-@pytest.fixture
-def sample_graph():
-    """Provide a sample graph for testing"""
-    nodes = ["A", "B", "C", "D"]
-    edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")]
-    edge_caps = {
-        ("A", "B"): 10,
-        ("A", "C"): 5,
-        ("B", "D"): 8,
-        ("C", "D"): 7
-    }
-    capacity_matrix = [
-        [0, 10, 5, 0],   # A
-        [0, 0, 0, 8],    # B
-        [0, 0, 0, 7],    # C
-        [0, 0, 0, 0]     # D
-    ]
-    return nodes, edges, edge_caps, capacity_matrix
-
-
-@pytest.fixture
-def simple_network():
-    """Provide a simple flow network for testing"""
-    # Simple network: A -> B -> C with capacities
-    capacity_matrix = [
-        [0, 10, 0],  # A
-        [0, 0, 15],  # B
-        [0, 0, 0]    # C
-    ]
-    return capacity_matrix
-
-
 # ============================================================================
 # DATABASE TESTS (database.py)
 # ============================================================================
@@ -102,82 +66,71 @@ def simple_network():
 class TestDatabase:
     """Test suite for database.py module"""
     
-    def test_validate_player_name_valid(self):
+    @pytest.mark.parametrize("name", [
+        "Alice",
+        "Bob123",
+        "John_Doe",
+        "Player-1",
+        "Test User",
+        "AB"  # minimum length
+    ])
+    def test_validate_player_name_valid(self, db, name):
         """Test valid player names"""
-        valid_names = [
-            "Alice",
-            "Bob123",
-            "John_Doe",
-            "Player-1",
-            "Test User",
-            "AB"  # minimum length
-        ]
-        
-        for name in valid_names:
-            is_valid, error_msg = validate_player_name(name)
-            assert is_valid == True, f"Expected {name} to be valid"
-            assert error_msg == ""
-    
-    def test_validate_player_name_invalid(self):
+        is_valid, error_msg = db.validate_player_name(name)
+        assert is_valid == True, f"Expected {name} to be valid"
+        assert error_msg == ""
+    
+    @pytest.mark.parametrize("name, expected_error_substring", [
+        ("", "Player name cannot be empty"),
+        ("A", "Player name must be at least 2 characters"),
+        ("a" * 51, "Player name cannot exceed 50 characters"),
+        ("Player@#$", "Player name contains invalid characters"),
+        ("Test<script>", "Player name contains invalid characters"),
+        (None, "Player name cannot be empty"),
+        (123, "Player name must be a string"),
+    ])
+    def test_validate_player_name_invalid(self, db, name, expected_error_substring):
         """Test invalid player names"""
-        invalid_cases = [
-            ("", "Player name cannot be empty"),
-            ("A", "Player name must be at least 2 characters"),
-            ("a" * 51, "Player name cannot exceed 50 characters"),
-            ("Player@#$", "Player name contains invalid characters"),
-            ("Test<script>", "Player name contains invalid characters"),
-            (None, "Player name cannot be empty"),
-            (123, "Player name must be a string"),
-        ]
-        
-        for name, expected_error_substring in invalid_cases:
-            is_valid, error_msg = validate_player_name(name)
-            assert is_valid == False, f"Expected {name} to be invalid"
-            assert expected_error_substring in error_msg or error_msg != ""
+        is_valid, error_msg = db.validate_player_name(name)
+        assert is_valid == False, f"Expected {name} to be invalid"
+        assert expected_error_substring in error_msg or error_msg != ""
     
-    def test_validate_player_name_whitespace(self):
+    def test_validate_player_name_whitespace(self, db):
         """Test player names with whitespace"""
-        is_valid, _ = validate_player_name("  Alice  ")
+        is_valid, _ = db.validate_player_name("  Alice  ")
         assert is_valid == True
         
-        is_valid, _ = validate_player_name("   ")
+        is_valid, _ = db.validate_player_name("   ")
         assert is_valid == False
     
-    def test_validate_answer_valid(self):
+    @pytest.mark.parametrize("answer", [0, 1, 10, 100, 1000, "42", "0"])
+    def test_validate_answer_valid(self, db, answer):
         """Test valid answers"""
-        valid_answers = [0, 1, 10, 100, 1000, "42", "0"]
-        
-        for answer in valid_answers:
-            is_valid, error_msg = validate_answer(answer)
-            assert is_valid == True, f"Expected {answer} to be valid"
-            assert error_msg == ""
-    
-    def test_validate_answer_invalid(self):
+        is_valid, error_msg = db.validate_answer(answer)
+        assert is_valid == True, f"Expected {answer} to be valid"
+        assert error_msg == ""
+    
+    @pytest.mark.parametrize("answer, expected_error_substring", [
+        (None, "Answer cannot be None"),
+        (-1, "Answer must be a non-negative integer"),
+        (-100, "Answer must be a non-negative integer"),
+        ("abc", "Answer must be a valid integer"),
+        ("12.5", "Answer must be a valid integer"),
+        ([], "Answer must be a valid integer"),
+        ({}, "Answer must be a valid integer"),
+    ])
+    def test_validate_answer_invalid(self, db, answer, expected_error_substring):
         """Test invalid answers"""
-        invalid_answers = [
-            (None, "Answer cannot be None"),
-            (-1, "Answer must be a non-negative integer"),
-            (-100, "Answer must be a non-negative integer"),
-            ("abc", "Answer must be a valid integer"),
-            ("12.5", "Answer must be a valid integer"),
-            ([], "Answer must be a valid integer"),
-            ({}, "Answer must be a valid integer"),
-        ]
-        
-        for answer, expected_error_substring in invalid_answers:
-            is_valid, error_msg = validate_answer(answer)
-            assert is_valid == False, f"Expected {answer} to be invalid"
-            assert expected_error_substring in error_msg
+        is_valid, error_msg = db.validate_answer(answer)
+        assert is_valid == False, f"Expected {answer} to be invalid"
+        assert expected_error_substring in error_msg
     
-    def test_init_db_creates_table(self):
+    def test_init_db_creates_table(self, db, db_conn):
         """Test database initialization creates table"""
-        from database import DB_PATH
-        
-        init_db()
+        db.init_db()
         
         # Verify table exists
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        cursor = db_conn.cursor()
         
         # Check win_results table exists
         cursor.execute("""
@@ -195,18 +148,14 @@ class TestDatabase:
         result = cursor.fetchone()
         assert result is not None
         assert result[0] == 'all_game_results'
-        
-        conn.close()
     
-    def test_insert_correct_result_valid(self):
+    def test_insert_correct_result_valid(self, db, db_conn):
         """Test inserting valid correct results"""
-        from database import DB_PATH
-        
-        init_db()
-        clear_db()
+        db.init_db()
+        db.clear_db()
         
         # Insert valid result
-        success, message = insert_correct_result(
+        success, message = db.insert_correct_result(
             "TestPlayer",
             42,
             42,
@@ -218,20 +167,16 @@ class TestDatabase:
         assert "success" in message.lower()
         
         # Verify insertion
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM win_results")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = db_conn.execute("SELECT * FROM win_results").fetchall()
         
         assert len(rows) == 1
         assert rows[0][1] == "TestPlayer"
         assert rows[0][2] == 42
         assert rows[0][3] == 42
     
-    def test_insert_correct_result_invalid_name(self):
+    def test_insert_correct_result_invalid_name(self, db):
         """Test inserting result with invalid player name"""
-        success, message = insert_correct_result(
+        success, message = db.insert_correct_result(
             "",  # Invalid empty name
             42,
             42,
@@ -242,9 +187,9 @@ class TestDatabase:
         assert success == False
         assert "name" in message.lower()
     
-    def test_insert_correct_result_invalid_answer(self):
+    def test_insert_correct_result_invalid_answer(self, db):
         """Test inserting result with invalid answer"""
-        success, message = insert_correct_result(
+        success, message = db.insert_correct_result(
             "ValidPlayer",
             -1,  # Negative answer
             -1,
@@ -255,9 +200,9 @@ class TestDatabase:
         assert success == False
         assert "answer" in message.lower() or "negative" in message.lower()
     
-    def test_insert_correct_result_invalid_times(self):
+    def test_insert_correct_result_invalid_times(self, db):
         """Test inserting result with invalid execution times"""
-        success, message = insert_correct_result(
+        success, message = db.insert_correct_result(
             "ValidPlayer",
             42,
             42,
@@ -268,15 +213,13 @@ class TestDatabase:
         assert success == False
         assert "time" in message.lower() or "negative" in message.lower()
     
-    def test_insert_correct_result_sanitizes_input(self):
+    def test_insert_correct_result_sanitizes_input(self, db, db_conn):
         """Test that player name is sanitized"""
-        from database import DB_PATH
-        
-        init_db()
-        clear_db()
+        db.init_db()
+        db.clear_db()
         
         # Insert with whitespace
-        success, _ = insert_correct_result(
+        success, _ = db.insert_correct_result(
             "  TestPlayer  ",
             42,
             42,
@@ -287,11 +230,7 @@ class TestDatabase:
         assert success == True
         
         # Verify trimmed
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT player_name FROM win_results")
-        name = cursor.fetchone()[0]
-        conn.close()
+        name = db_conn.execute("SELECT player_name FROM win_results").fetchone()[0]
         
         assert name == "TestPlayer"
 
@@ -398,41 +337,53 @@ class TestGraph:
         for i in range(len(NODES)):
             assert matrix[i][i] == 0
     
-    def test_new_random_graph_returns_four_values(self):
-        """Test new_random_graph returns 4 values"""
+    def test_new_random_graph_returns_five_values(self):
+        """Test new_random_graph returns 5 values"""
         result = new_random_graph()
-        assert len(result) == 4
+        assert len(result) == 5
     
     def test_new_random_graph_nodes(self):
         """Test new_random_graph returns correct nodes"""
-        nodes, _, _, _ = new_random_graph()
+        nodes, _, _, _, _ = new_random_graph()
         assert nodes == NODES
     
     def test_new_random_graph_edges(self):
         """Test new_random_graph returns correct edges"""
-        _, edges, _, _ = new_random_graph()
+        _, edges, _, _, _ = new_random_graph()
         assert edges == EDGES
     
     def test_new_random_graph_edge_caps(self):
         """Test new_random_graph returns valid edge_caps"""
-        _, _, edge_caps, _ = new_random_graph()
+        _, _, edge_caps, _, _ = new_random_graph()
         assert isinstance(edge_caps, dict)
         assert len(edge_caps) == len(EDGES)
     
     def test_new_random_graph_capacity_matrix(self):
         """Test new_random_graph returns valid capacity matrix"""
-        _, _, _, capacity_mat = new_random_graph()
+        _, _, _, capacity_mat, _ = new_random_graph()
         assert len(capacity_mat) == len(NODES)
         assert all(len(row) == len(NODES) for row in capacity_mat)
     
     def test_new_random_graph_consistency(self):
         """Test edge_caps and capacity_matrix are consistent"""
-        nodes, _, edge_caps, capacity_mat = new_random_graph()
+        _, _, edge_caps, capacity_mat, node_idx = new_random_graph()
         
         for (u, v), cap in edge_caps.items():
-            ui = nodes.index(u)
-            vi = nodes.index(v)
-            assert capacity_mat[ui][vi] == cap
+            assert capacity_mat[node_idx[u]][node_idx[v]] == cap
+    
+    def test_new_random_graph_node_index(self):
+        """Test node_index maps every node to its position in NODES"""
+        nodes, _, _, _, node_idx = new_random_graph()
+        assert node_idx == NODE_INDEX
+        for i, name in enumerate(nodes):
+            assert node_idx[name] == i
+    
+    def test_new_random_graph_node_index_read_only(self):
+        """Test callers can't change the node_index shared by every graph"""
+        _, _, _, _, node_idx = new_random_graph()
+        with pytest.raises(TypeError):
+            node_idx["Z"] = 99
+        assert "Z" not in new_random_graph()[4]
 
 
 # ============================================================================
@@ -597,14 +548,12 @@ class TestMaxFlowAlgorithms:
 class TestUtils:
     """Test suite for utils.py module"""
     
-    def test_validate_int_valid_integer(self):
+    @pytest.mark.parametrize("text", ["0", "1", "42", "100", "9999"])
+    def test_validate_int_valid_integer(self, text):
         """Test validate_int with valid integers"""
-        valid_cases = ["0", "1", "42", "100", "9999"]
-        
-        for text in valid_cases:
-            is_valid, value = validate_int(text)
-            assert is_valid == True
-            assert value == int(text)
+        is_valid, value = validate_int(text)
+        assert is_valid == True
+        assert value == int(text)
     
     def test_validate_int_negative_integer(self):
         """Test validate_int with negative integers"""
@@ -612,14 +561,12 @@ class TestUtils:
         assert is_valid == True
         assert value == -5
     
-    def test_validate_int_invalid_text(self):
+    @pytest.mark.parametrize("text", ["abc", "12.5", "", "  ", "1a2", "NaN"])
+    def test_validate_int_invalid_text(self, text):
         """Test validate_int with invalid text"""
-        invalid_cases = ["abc", "12.5", "", "  ", "1a2", "NaN"]
-        
-        for text in invalid_cases:
-            is_valid, value = validate_int(text)
-            assert is_valid == False
-            assert value is None
+        is_valid, value = validate_int(text)
+        assert is_valid == False
+        assert value is None
     
     def test_validate_int_whitespace(self):
         """Test validate_int with whitespace"""
@@ -627,6 +574,23 @@ class TestUtils:
         assert is_valid == True
         assert value == 42
     
+    @pytest.mark.parametrize("text, expected", [
+        (5, 5), (-3, -3), (True, 1), (7.9, 7), (b"12", 12),
+        ("1_000", 1000), ("-2_5", -25), (" +1_0 ", 10),
+    ])
+    def test_validate_int_matches_int(self, text, expected):
+        """Test validate_int accepts whatever int() accepts"""
+        is_valid, value = validate_int(text)
+        assert is_valid == True
+        assert value == expected
+    
+    @pytest.mark.parametrize("text", [None, [1], float("inf"), float("nan"), "1__0", "_1", "1_", "+", "-"])
+    def test_validate_int_rejects_what_int_rejects(self, text):
+        """Test validate_int rejects whatever int() rejects"""
+        is_valid, value = validate_int(text)
+        assert is_valid == False
+        assert value is None
+    
     def test_time_function_basic(self):
         """Test time_function with basic function"""
         def dummy_func():
@@ -681,6 +645,21 @@ class TestUtils:
         assert isinstance(result, tuple)
         assert len(result) == 2
 
+    def test_time_function_repeat(self):
+        """Test time_function_repeat runs n times and returns mean time"""
+        calls = []
+        
+        def add(a, b):
+            calls.append(1)
+            return a + b
+        
+        result, elapsed = time_function_repeat(add, 5, 2, 3)
+        
+        assert result == 5
+        assert len(calls) == 5
+        assert isinstance(elapsed, float)
+        assert elapsed >= 0
+
 
 # ============================================================================
 # INTEGRATION TESTS
@@ -692,11 +671,11 @@ class TestIntegration:
     def test_full_game_flow(self):
         """Test complete game flow from graph generation to flow calculation"""
         # Generate graph
-        nodes, edges, edge_caps, capacity_mat = new_random_graph()
+        nodes, edges, edge_caps, capacity_mat, node_idx = new_random_graph()
         
         # Calculate flow using both algorithms
-        source_idx = nodes.index("A")
-        sink_idx = nodes.index("T")
+        source_idx = node_idx["A"]
+        sink_idx = node_idx["T"]
         
         ek_flow = edmonds_karp(capacity_mat, source_idx, sink_idx)
         
@@ -716,17 +695,15 @@ class TestIntegration:
     
     def test_graph_to_algorithm_pipeline(self):
         """Test pipeline from graph generation to algorithm execution"""
-        nodes, _, edge_caps, capacity_mat = new_random_graph()
+        _, _, edge_caps, capacity_mat, node_idx = new_random_graph()
         
         # Verify matrix consistency
         for (u, v), cap in edge_caps.items():
-            ui = nodes.index(u)
-            vi = nodes.index(v)
-            assert capacity_mat[ui][vi] == cap
+            assert capacity_mat[node_idx[u]][node_idx[v]] == cap
         
         # Run algorithm
-        source_idx = nodes.index("A")
-        sink_idx = nodes.index("T")
+        source_idx = node_idx["A"]
+        sink_idx = node_idx["T"]
         max_flow = edmonds_karp(capacity_mat, source_idx, sink_idx)
         
         # Validate result
@@ -735,9 +712,9 @@ class TestIntegration:
     
     def test_timed_algorithm_execution(self):
         """Test timing both algorithms"""
-        nodes, _, _, capacity_mat = new_random_graph()
-        source_idx = nodes.index("A")
-        sink_idx = nodes.index("T")
+        _, _, _, capacity_mat, node_idx = new_random_graph()
+        source_idx = node_idx["A"]
+        sink_idx = node_idx["T"]
         
         # Time EK
         ek_flow, ek_time = time_function(edmonds_karp, capacity_mat, source_idx, sink_idx)
@@ -751,16 +728,14 @@ class TestIntegration:
         assert ek_time >= 0
         assert dinic_time >= 0
     
-    def test_database_workflow(self):
+    def test_database_workflow(self, db, db_conn):
         """Test complete database workflow"""
-        from database import DB_PATH
-        
-        init_db()
-        clear_db()
+        db.init_db()
+        db.clear_db()
         
         # Insert multiple results
         for i in range(3):
-            success, _ = insert_correct_result(
+            success, _ = db.insert_correct_result(
                 f"Player{i}",
                 10 + i,
                 10 + i,
@@ -770,22 +745,17 @@ class TestIntegration:
             assert success == True
         
         # Verify all inserted
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM win_results")
-        count = cursor.fetchone()[0]
-        conn.close()
+        count = db_conn.execute("SELECT COUNT(*) FROM win_results").fetchone()[0]
         
         assert count == 3
     
-    def test_insert_all_result_correct_guess(self):
+    def test_insert_all_result_correct_guess(self, db, db_conn):
         """Test inserting a correct guess into all_game_results"""
-        from database import DB_PATH
-        
-        init_db()
+        db.init_db()
+        db.clear_db()
         
         # Insert correct result
-        success, message = insert_all_result(
+        success, message = db.insert_all_result(
             "TestPlayer",
             42,
             42,
@@ -797,26 +767,20 @@ class TestIntegration:
         assert "success" in message.lower()
         
         # Verify insertion
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM all_game_results")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = db_conn.execute("SELECT * FROM all_game_results").fetchall()
         
         assert len(rows) == 1
         assert rows[0][1] == "TestPlayer"
         assert rows[0][2] == 42
         assert rows[0][3] == 42
     
-    def test_insert_all_result_wrong_guess(self):
+    def test_insert_all_result_wrong_guess(self, db, db_conn):
         """Test inserting a wrong guess into all_game_results"""
-        from database import DB_PATH
-        
-        init_db()
-        clear_db()
+        db.init_db()
+        db.clear_db()
         
         # Insert wrong result (guess 30, correct 42)
-        success, message = insert_all_result(
+        success, message = db.insert_all_result(
             "TestPlayer",
             30,
             42,
@@ -827,19 +791,13 @@ class TestIntegration:
         assert success == True
         
         # Verify insertion
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM all_game_results")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = db_conn.execute("SELECT * FROM all_game_results").fetchall()
         
         assert len(rows) == 1
-    def test_insert_all_result_multiple(self):
+    def test_insert_all_result_multiple(self, db, db_conn):
         """Test inserting multiple results (both correct and incorrect)"""
-        from database import DB_PATH
-        
-        init_db()
-        clear_db()
+        db.init_db()
+        db.clear_db()
         
         # Insert mixed results
         test_cases = [
@@ -849,33 +807,25 @@ class TestIntegration:
         ]
         
         for name, guess, correct in test_cases:
-            success, _ = insert_all_result(name, guess, correct, 0.001, 0.002)
+            success, _ = db.insert_all_result(name, guess, correct, 0.001, 0.002)
             assert success == True
         
         # Verify all inserted
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM all_game_results")
-        count = cursor.fetchone()[0]
-        conn.close()
+        count = db_conn.execute("SELECT COUNT(*) FROM all_game_results").fetchone()[0]
         
         assert count == 3
     
-    def test_sqlite_sequence_removed(self):
+    def test_sqlite_sequence_removed(self, db, db_conn):
         """Test that sqlite_sequence table is removed"""
-        from database import DB_PATH
-        
-        init_db()
+        db.init_db()
         
         # Check sqlite_sequence does not exist
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        cursor = db_conn.cursor()
         cursor.execute("""
             SELECT name FROM sqlite_master 
             WHERE type='table' AND name='sqlite_sequence'
         """)
         result = cursor.fetchone()
-        conn.close()
         
         assert result is None, "sqlite_sequence table should not exist"
 
@@ -924,36 +874,36 @@ class TestEdgeCases:
         max_flow = edmonds_karp(capacity, 0, 2)
         assert max_flow == 0
     
-    def test_player_name_boundary_lengths(self):
+    def test_player_name_boundary_lengths(self, db):
         """Test player names at boundary lengths"""
         # Minimum length (2 chars)
-        is_valid, _ = validate_player_name("AB")
+        is_valid, _ = db.validate_player_name("AB")
         assert is_valid == True
         
         # Just below minimum
-        is_valid, _ = validate_player_name("A")
+        is_valid, _ = db.validate_player_name("A")
         assert is_valid == False
         
         # Maximum length (50 chars)
-        is_valid, _ = validate_player_name("A" * 50)
+        is_valid, _ = db.validate_player_name("A" * 50)
         assert is_valid == True
         
         # Just above maximum
-        is_valid, _ = validate_player_name("A" * 51)
+        is_valid, _ = db.validate_player_name("A" * 51)
         assert is_valid == False
     
-    def test_answer_boundary_values(self):
+    def test_answer_boundary_values(self, db):
         """Test answer validation at boundaries"""
         # Zero
-        is_valid, _ = validate_answer(0)
+        is_valid, _ = db.validate_answer(0)
         assert is_valid == True
         
         # Just below zero
-        is_valid, _ = validate_answer(-1)
+        is_valid, _ = db.validate_answer(-1)
         assert is_valid == False
         
         # Large positive
-        is_valid, _ = validate_answer(999999)
+        is_valid, _ = db.validate_answer(999999)
         assert is_valid == True
 
 
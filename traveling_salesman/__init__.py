@@ -14,20 +14,11 @@ Developed as part of the PDSA coursework.
 
 
 from .game import Game
-from .ui import draw_ui, show_win, show_lose
 
 def launch_game() -> None:
+	# the UI pulls in customtkinter and matplotlib, so it is only imported
+	# when the game is actually launched, not whenever the package is
+	from .ui import draw_ui
+
 	game = Game()
 	draw_ui(game)
-
-	is_algorithms_complete_running: bool = False
-
-	# run algoritms
-	correct_path: list[str] = []
-
-	if is_algorithms_complete_running:
-		if game.is_won:
-			show_win()
-		else:
-			correct_path_str = " -> ".join(correct_path)
-			show_lose(correct_path_str)
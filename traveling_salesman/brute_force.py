@@ -1,4 +1,4 @@
-import itertools
+from operator import getitem
 
 class BruteForce:
 	def __init__(self, main_city: str, main_city_index: int, choosen_cities: list[str], distance_matrix: list[list[int]], all_cities: list[str]) -> None:
@@ -9,33 +9,54 @@ class BruteForce:
 		self.best_distance = float('inf')
 		self.best_route = []
 
-		# Map city names to their global indices in the distance matrix
-		self.city_to_global_index: dict[str, int] = {city: all_cities.index(city) for city in self.choosen_cities}
-		self.city_to_index: dict[str, int] = {city: i for i, city in enumerate(self.choosen_cities)}
+		# Global indices of the chosen cities in the distance matrix; the
+		# search works on these ints only, never on the city names
+		self.all_cities = all_cities
+		self.choosen_indices: list[int] = [all_cities.index(city) for city in self.choosen_cities]
 		self.main_city_index = main_city_index
 
 	def start(self) -> tuple[int, list[str]]:
 		# Edge case: if no cities are selected, return main city to itself
 		if len(self.choosen_cities) == 0:
 			return 0, [self.main_city, self.main_city]
-		
-		for perm in itertools.permutations(self.choosen_cities):
-			total: int = 0
-			# go to first city (use global indices)
-			total += self.distance_matrix[self.main_city_index][self.city_to_global_index[perm[0]]]
-
-			# then visit others in order (use global indices for distance matrix)
-			for i in range(len(perm) - 1):
-				a = self.city_to_global_index[perm[i]]
-				b = self.city_to_global_index[perm[i+1]]
-				total += self.distance_matrix[a][b]
-
-			# return to main (use global indices)
-			total += self.distance_matrix[self.city_to_global_index[perm[-1]]][self.main_city_index]
-
-			# check if this route is better
-			if total < self.best_distance:
-				self.best_distance = total
-				self.best_route = [self.main_city, *perm, self.main_city]
+
+		dist = self.distance_matrix
+		k = len(self.choosen_cities)
+		# full tour as global indices: main -> chosen cities... -> main
+		tour = [self.main_city_index, *self.choosen_indices, self.main_city_index]
+		cost: int = sum(map(getitem, map(dist.__getitem__, tour[:-1]), tour[1:]))
+		self.best_distance = cost
+		best_tour = tour[:]
+
+		# Heap's algorithm (iterative): every next permutation of the interior
+		# differs from the previous one by a single swap, so only the edges
+		# touching the two swapped positions have to be re-costed
+		counters = [0] * k
+		i = 1
+		while i < k:
+			if counters[i] < i:
+				# swapped tour positions p < q (interior position + 1)
+				p = 1 if i % 2 == 0 else counters[i] + 1
+				q = i + 1
+				# edge e joins tour[e] -> tour[e + 1]
+				edges = (p - 1, p, q) if q == p + 1 else (p - 1, p, q - 1, q)
+				for e in edges:
+					cost -= dist[tour[e]][tour[e + 1]]
+				tour[p], tour[q] = tour[q], tour[p]
+				for e in edges:
+					cost += dist[tour[e]][tour[e + 1]]
+
+				# check if this route is better
+				if cost < self.best_distance:
+					self.best_distance = cost
+					best_tour = tour[:]
+
+				counters[i] += 1
+				i = 1
+			else:
+				counters[i] = 0
+				i += 1
+
+		self.best_route = [self.main_city, *(self.all_cities[i] for i in best_tour[1:-1]), self.main_city]
 
 		return self.best_distance, self.best_route
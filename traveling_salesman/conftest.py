@@ -0,0 +1,86 @@
+"""
+Shared pytest fixtures for the Traveling Salesman Problem tests.
+
+The distance matrices and city lists are read-only constants built once per
+session; the city lists are tuples, so no test can change them for another.
+Tests that only inspect a Game share one instance (`shared_game`); tests
+that mutate or reset it get their own (`game`).
+"""
+
+import pytest
+from traveling_salesman.game import Game
+
+
+# ==================== Distance Matrix Fixtures ====================
+
+# Constants the algorithms only read, so each is built once per session
+@pytest.fixture(scope="session")
+def simple_distance_matrix():
+	"""Simple 4-city distance matrix for testing."""
+	# Cities: A, B, C, D
+	# A-B: 10, A-C: 15, A-D: 20
+	# B-C: 35, B-D: 25
+	# C-D: 30
+	return [
+		[0, 10, 15, 20],  # A
+		[10, 0, 35, 25],  # B
+		[15, 35, 0, 30],  # C
+		[20, 25, 30, 0]   # D
+	]
+
+
+@pytest.fixture(scope="session")
+def symmetric_distance_matrix():
+	"""Symmetric 5-city distance matrix."""
+	# Cities: A, B, C, D, E
+	return [
+		[0, 10, 20, 30, 40],   # A
+		[10, 0, 15, 25, 35],   # B
+		[20, 15, 0, 12, 22],   # C
+		[30, 25, 12, 0, 18],   # D
+		[40, 35, 22, 18, 0]    # E
+	]
+
+
+@pytest.fixture(scope="session")
+def triangle_inequality_matrix():
+	"""Distance matrix that satisfies triangle inequality."""
+	# Cities: A, B, C
+	return [
+		[0, 5, 8],   # A
+		[5, 0, 6],   # B
+		[8, 6, 0]    # C
+	]
+
+
+@pytest.fixture(scope="session")
+def all_cities_simple():
+	"""List of cities for simple matrix."""
+	return ('A', 'B', 'C', 'D')
+
+
+@pytest.fixture(scope="session")
+def all_cities_symmetric():
+	"""List of cities for symmetric matrix."""
+	return ('A', 'B', 'C', 'D', 'E')
+
+
+@pytest.fixture(scope="session")
+def all_cities_triangle():
+	"""List of cities for triangle matrix."""
+	return ('A', 'B', 'C')
+
+
+# ==================== Game Fixtures ====================
+
+@pytest.fixture(scope="session")
+def shared_game():
+	"""One Game for the whole session, for tests that only read its state."""
+	return Game()
+
+
+@pytest.fixture
+def game():
+	"""Fresh Game for tests that mutate or reset it."""
+	# Game() is cheaper than deep-copying a prototype, so it is just built again
+	return Game()
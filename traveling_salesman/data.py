@@ -13,13 +13,29 @@ from common.db_base import get_connection, close_connection
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "App.db")
 
 
+def _connect() -> sqlite3.Connection:
+	"""
+	Open a connection to DB_PATH.
+
+	synchronous is a per-connection setting, so NORMAL only affects this
+	game's connections; it syncs less often than the default FULL. The
+	journal mode is left alone: it is stored in App.db, which the other
+	games share.
+
+	:return: sqlite3.Connection object
+	"""
+	conn = get_connection(DB_PATH)
+	conn.execute("PRAGMA synchronous=NORMAL")
+	return conn
+
+
 def init_database() -> None:
 	"""
 	Initialize the database and create tables if they don't exist.
 	"""
 	conn = None
 	try:
-		conn = get_connection(DB_PATH)
+		conn = _connect()
 		cursor = conn.cursor()
 		
 		# Table 1: Rounds (to track each game round) - must be created first for foreign keys
@@ -77,7 +93,7 @@ def create_round(player_name: str, main_city: str) -> int:
 	"""
 	conn = None
 	try:
-		conn = get_connection(DB_PATH)
+		conn = _connect()
 		cursor = conn.cursor()
 		
 		cursor.execute("""
@@ -105,14 +121,14 @@ def save_algorithm_times(round_id: int, algorithm_times: dict[str, float]) -> No
 	"""
 	conn = None
 	try:
-		conn = get_connection(DB_PATH)
+		conn = _connect()
 		cursor = conn.cursor()
 		
-		for algorithm_name, time_taken in algorithm_times.items():
-			cursor.execute("""
-				INSERT INTO tsp_algorithm_times (round_id, algorithm_name, time_taken)
-				VALUES (?, ?, ?)
-			""", (round_id, algorithm_name, time_taken))
+		# one statement for all rows, committed once below
+		cursor.executemany("""
+			INSERT INTO tsp_algorithm_times (round_id, algorithm_name, time_taken)
+			VALUES (?, ?, ?)
+		""", [(round_id, algorithm_name, time_taken) for algorithm_name, time_taken in algorithm_times.items()])
 		
 		conn.commit()
 	except sqlite3.Error as e:
@@ -136,7 +152,7 @@ def save_player_win(round_id: int, player_name: str, home_city: str,
 	"""
 	conn = None
 	try:
-		conn = get_connection(DB_PATH)
+		conn = _connect()
 		cursor = conn.cursor()
 		
 		# Convert lists to comma-separated strings for storage
@@ -1,51 +1,64 @@
-import multiprocessing
 import random
+import time
 
 from .brute_force import BruteForce
 from .held_karp import HeldKarpDP
 from .nn_2opt import NearestNeighbor2Opt
 
-# Worker functions for multiprocessing (must be at module level for Windows)
-def run_brute_force(args: tuple) -> tuple[int, list[str], float]:
-	import time
-	main_city, main_city_index, selected_cities, distance_matrix, all_cities = args
-	start_time = time.perf_counter()  # Use perf_counter for more precise timing
+# possible distances between two cities, inclusive of both ends. These are
+# CPython's cached small ints, so a list-of-lists matrix stores one pointer per
+# cell and no int objects; bytearray rows would be smaller still, but indexing
+# them is measurably slower in the brute-force inner loop.
+_DISTANCES = range(50, 101)
+
+# Timed runners for each algorithm; only start() is timed, not construction
+def run_brute_force(main_city: str, main_city_index: int, selected_cities: list[str], distance_matrix: list[list[int]], all_cities: list[str]) -> tuple[int, list[str], float]:
 	bf = BruteForce(main_city, main_city_index, selected_cities, distance_matrix, all_cities)
+	start_time = time.perf_counter_ns()
 	distance, path = bf.start()
-	elapsed = time.perf_counter() - start_time
-	return distance, path, float(elapsed)
+	elapsed = (time.perf_counter_ns() - start_time) * 1e-9
+	return distance, path, elapsed
 
-def run_held_karp(args: tuple) -> tuple[int, list[str], float]:
-	import time
-	main_city, all_cities, distance_matrix, selected_cities = args
-	start_time = time.perf_counter()  # Use perf_counter for more precise timing
+def run_held_karp(main_city: str, all_cities: list[str], distance_matrix: list[list[int]], selected_cities: list[str]) -> tuple[int, list[str], float]:
 	hk = HeldKarpDP(main_city, all_cities, distance_matrix, selected_cities)
+	start_time = time.perf_counter_ns()
 	distance, path = hk.start()
-	elapsed = time.perf_counter() - start_time
-	return distance, path, float(elapsed)
-
-def run_nn_2opt(args: tuple) -> tuple[int, list[str], float]:
-	import time
-	main_city, selected_cities, distance_matrix = args
-	start_time = time.perf_counter()  # Use perf_counter for more precise timing
-	nn = NearestNeighbor2Opt(main_city, selected_cities, distance_matrix)
+	elapsed = (time.perf_counter_ns() - start_time) * 1e-9
+	return distance, path, elapsed
+
+def run_nn_2opt(main_city: str, selected_cities: list[str], distance_matrix: list[list[int]], all_cities: list[str]) -> tuple[int, list[str], float]:
+	# NearestNeighbor2Opt indexes by position in [main_city] + selected_cities,
+	# so hand it that submatrix rather than the full matrix
+	ordered = [main_city] + [city for city in selected_cities if city != main_city]
+	indices = [all_cities.index(city) for city in ordered]
+	sub_matrix = [[row[j] for j in indices] for row in (distance_matrix[i] for i in indices)]
+	nn = NearestNeighbor2Opt(main_city, selected_cities, sub_matrix)
+	start_time = time.perf_counter_ns()
 	distance, path = nn.start()
-	elapsed = time.perf_counter() - start_time
-	return distance, path, float(elapsed)
+	elapsed = (time.perf_counter_ns() - start_time) * 1e-9
+	return distance, path, elapsed
+
+def generate_distance_matrix(n: int) -> list[list[int]]:
+	# draw every upper-triangle distance in one call, then mirror it
+	distances = iter(random.choices(_DISTANCES, k=n * (n - 1) // 2))
+	matrix = [[0] * n for _ in range(n)]
+	for i in range(n):
+		row = matrix[i]
+		for j in range(i + 1, n):
+			row[j] = matrix[j][i] = next(distances)
+	return matrix
 
 class Game:
+	# fixed attribute set; is_won and algorithm_times only exist once a round has been checked
+	__slots__ = ("cities", "distance_matrix", "main_city", "player_selected_cities", "is_won", "algorithm_times")
+
 	def __init__(self) -> None:
 		# define cities
 		self.cities = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
 		n = len(self.cities)
 
 		# define and fill the distance matrix
-		self.distance_matrix: list[list[int]] = [[0] * n for _ in range(n)]
-		for i in range(n):
-			for j in range(i + 1, n):
-				distance = random.randint(50, 100)
-				self.distance_matrix[i][j] = distance
-				self.distance_matrix[j][i] = distance
+		self.distance_matrix: list[list[int]] = generate_distance_matrix(n)
 
 		# choose main city
 		self.main_city: str = random.choice(self.cities)
@@ -57,12 +70,7 @@ class Game:
 		n = len(self.cities)
 		
 		# Generate new distance matrix
-		self.distance_matrix: list[list[int]] = [[0] * n for _ in range(n)]
-		for i in range(n):
-			for j in range(i + 1, n):
-				distance = random.randint(50, 100)
-				self.distance_matrix[i][j] = distance
-				self.distance_matrix[j][i] = distance
+		self.distance_matrix: list[list[int]] = generate_distance_matrix(n)
 		
 		# Choose new main city
 		self.main_city: str = random.choice(self.cities)
@@ -77,22 +85,17 @@ class Game:
 			self.is_won = False
 
 	def run_algorithms(self, player_guess: list[str]) -> tuple[bool, list[str]]:
-		# Prepare arguments for each algorithm
 		main_city_index = self.cities.index(self.main_city)
-		bf_args = (self.main_city, main_city_index, self.player_selected_cities, self.distance_matrix, self.cities)
-		hk_args = (self.main_city, self.cities, self.distance_matrix, self.player_selected_cities)
-		nn_args = (self.main_city, self.player_selected_cities, self.distance_matrix)
-
-		# Run algorithms in parallel using multiprocessing
-		with multiprocessing.Pool(processes=3) as pool:
-			bf_result = pool.apply_async(run_brute_force, (bf_args,))
-			hk_result = pool.apply_async(run_held_karp, (hk_args,))
-			nn_result = pool.apply_async(run_nn_2opt, (nn_args,))
-
-			# Get results
-			bf_distance, bf_path, bf_time = bf_result.get()
-			hk_distance, hk_path, hk_time = hk_result.get()
-			nn_distance, nn_path, nn_time = nn_result.get()
+
+		# Run algorithms sequentially in-process: with at most 7 cities each one
+		# takes microseconds to milliseconds, far less than spawning workers
+		# and pickling the arguments and results would cost. A thread pool
+		# would not help either: the algorithms are pure Python and hold the
+		# GIL, and running them side by side would inflate each measured time.
+		# All three share the same distance matrix object; nothing is copied.
+		bf_distance, bf_path, bf_time = run_brute_force(self.main_city, main_city_index, self.player_selected_cities, self.distance_matrix, self.cities)
+		hk_distance, hk_path, hk_time = run_held_karp(self.main_city, self.cities, self.distance_matrix, self.player_selected_cities)
+		nn_distance, nn_path, nn_time = run_nn_2opt(self.main_city, self.player_selected_cities, self.distance_matrix, self.cities)
 		
 		# Store timing information (ensure times are floats)
 		self.algorithm_times = {
@@ -1,24 +1,93 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def _hk_schedule(n: int) -> tuple[tuple[int, tuple[tuple[int, int, tuple[int, ...]], ...]], ...]:
+	"""
+	Build the Held-Karp visiting order for n nodes, once per n.
+
+	:param n: Number of nodes
+	:return: One (mask, transitions) entry per subset containing node 0, smallest subsets
+	         first, where each transition is (j, prev_mask, ks): the subset ends at j and is
+	         reached from some k in ks, the nodes of prev_mask = mask without j. Node 0 is
+	         only in ks when prev_mask is {0}; no longer path ends back at the start.
+	"""
+	N = 1 << n
+	# Only subsets containing node 0 matter (the tour starts there). Group
+	# them by size so every prev_mask (one node smaller) is finished before
+	# it is read, and skip the even masks instead of testing each one.
+	masks_by_size: list[list[int]] = [[] for _ in range(n + 1)]
+	for mask in range(1, N, 2):
+		masks_by_size[mask.bit_count()].append(mask)
+
+	schedule = []
+	for size in range(2, n + 1):
+		for mask in masks_by_size[size]:
+			transitions = []
+			for j in range(1, n):
+				if mask & (1 << j):
+					prev_mask = mask ^ (1 << j)
+					ks = (0,) if prev_mask == 1 else tuple(k for k in range(1, n) if prev_mask & (1 << k))
+					transitions.append((j, prev_mask, ks))
+			schedule.append((mask, tuple(transitions)))
+	return tuple(schedule)
+
+
+def _held_karp_dp(matrix: list[list[int]], n: int) -> tuple[list[list[float]], bytearray]:
+	"""
+	Fill the Held-Karp tables for a tour starting at node 0.
+
+	:param matrix: n x n distance matrix
+	:param n: Number of nodes
+	:return: (dp, parent) where dp[mask][j] is the minimum cost to visit 'mask' ending at j
+	         and parent[mask * n + j] is the node visited before j on that path
+	"""
+	# Number of subsets: 2^n
+	N = 1 << n
+	INF = float('inf')
+
+	dp = [[INF] * n for _ in range(N)]
+	# one byte per predecessor (n is at most 8) in a single flat buffer
+	# instead of 2^n lists of boxed ints / None
+	parent = bytearray(N * n)
+	# columns[j][k] == matrix[k][j]: cost of the edge k -> j
+	columns = [list(col) for col in zip(*matrix)]
+
+	# Base case: start at node 0, mask = 1<<0
+	dp[1][0] = 0
+
+	# the subset/bit bookkeeping depends only on n, so it is cached per n
+	for mask, transitions in _hk_schedule(n):
+		dp_row = dp[mask]
+		parent_base = mask * n
+		for j, prev_mask, ks in transitions:
+			prev_row = dp[prev_mask]
+			column = columns[j]
+			best = INF
+			best_k = 0
+			# Try all possibilities of coming to j from some k in prev_mask
+			for k in ks:
+				cost = prev_row[k] + column[k]
+				if cost < best:
+					best = cost
+					best_k = k
+			dp_row[j] = best
+			parent[parent_base + j] = best_k
+
+	return dp, parent
+
+
 class HeldKarpDP:
 	def __init__(self, main_city: str, all_cities: list[str], distance_matrix: list[list[int]], selected_cities: list[str]) -> None:
 		# Filter out main city from selected_cities to avoid duplicates
 		selected_cities = [city for city in selected_cities if city != main_city]
 		# create new list with main city first and selected cities
 		self.ordered_city_list = [main_city] + selected_cities
-		# city name -> index in global matrix
-		global_indices = {city: i for i, city in enumerate(all_cities)}
-
-		n = len(self.ordered_city_list)
+		# index of each ordered city in the global matrix
+		indices = [all_cities.index(city) for city in self.ordered_city_list]
 
-		# create new matrix for hk
-		self.hk_matrix = [[0] * n for _ in range(n)]
-
-		# fill new matrix using distance matrix
-		for i in range(n):
-			for j in range(n):
-				city_i = self.ordered_city_list[i]
-				city_j = self.ordered_city_list[j]
-
-				self.hk_matrix[i][j] = distance_matrix[global_indices[city_i]][global_indices[city_j]]
+		# create new matrix for hk: the rows and columns of the ordered cities
+		self.hk_matrix = [[row[j] for j in indices] for row in (distance_matrix[i] for i in indices)]
 
 
 	def start(self) -> tuple[int, list[str]]:
@@ -27,40 +96,22 @@ class HeldKarpDP:
 		# Edge case: if only main city (n=1), return main city to itself
 		if n == 1:
 			return 0, [self.ordered_city_list[0], self.ordered_city_list[0]]
-		
-		# Number of subsets: 2^n
-		N = 1 << n
-		INF = float('inf')
 
-		# dp[mask][j] = minimum cost to reach subset 'mask' and end at node j
-		dp = [[INF] * n for _ in range(N)]
-		# parent[mask][j] = previous node before j in optimal path for (mask, j)
-		parent: list[list[int | None]] = [[None] * n for _ in range(N)]
-
-		# Base case: start at node 0, mask = 1<<0
-		dp[1][0] = 0
-
-		# Iterate over all subsets that include node 0
-		for mask in range(1, N):
-			if not (mask & 1):
-				continue  # we always require the tour to start at node 0
-
-			for j in range(1, n):
-				if not (mask & (1 << j)):
-					continue  # j not in subset
-
-				prev_mask = mask ^ (1 << j)
-				# Try all possibilities of coming to j from some k in prev_mask
-				for k in range(n):
-					if prev_mask & (1 << k):
-						cost = dp[prev_mask][k] + self.hk_matrix[k][j]
-						if cost < dp[mask][j]:
-							dp[mask][j] = cost
-							parent[mask][j] = k
+		# Edge case: with at most two other cities there are only two tours, so
+		# compare them directly instead of filling the DP tables (ending at
+		# node 1 first, the order the DP breaks ties in)
+		if n <= 3:
+			matrix = self.hk_matrix
+			tours = [[0, *range(n - 1, 0, -1), 0], [0, *range(1, n), 0]]
+			costs = [sum(matrix[a][b] for a, b in zip(tour, tour[1:])) for tour in tours]
+			best = costs.index(min(costs))
+			return costs[best], [self.ordered_city_list[i] for i in tours[best]]
+		
+		dp, parent = _held_karp_dp(self.hk_matrix, n)
 
 		# Close the tour: return to node 0
 		full_mask = (1 << n) - 1
-		min_cost = INF
+		min_cost = float('inf')
 		last = None
 		for j in range(1, n):
 			cost = dp[full_mask][j] + self.hk_matrix[j][0]
@@ -68,13 +119,13 @@ class HeldKarpDP:
 				min_cost = cost
 				last = j
 
-		# Reconstruct path
+		# Reconstruct path (ends once node 0 has been removed from the mask)
 		path = []
 		mask = full_mask
 		curr = last
-		while curr is not None:
+		while mask:
 			path.append(curr)
-			prev = parent[mask][curr]
+			prev = parent[mask * n + curr]
 			mask ^= (1 << curr) # ^ - xor operator
 			curr = prev
 		# Path now contains [last, ..., 0] in reverse order (ends with 0)
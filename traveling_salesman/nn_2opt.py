@@ -1,3 +1,51 @@
+def _two_opt(tour: list[int], dist: list[list[int]]) -> list[int]:
+	"""
+	Improve 'tour' in place with 2-opt moves until no move shortens it.
+
+	:param tour: Closed tour of node indices (first == last)
+	:param dist: Distance matrix indexed by node
+	:return: The improved tour
+	"""
+	n = len(tour)
+	# don't-look bits per node: set once no improving move starts at the
+	# node's edge to its predecessor, cleared again for every node in the
+	# stretch of the tour a move reverses
+	dont_look = [False] * len(dist)
+	# a move can also open up one further along the tour from a node whose bit
+	# is set, so the search only ends after a sweep that ignores the bits
+	# finds nothing to improve
+	check_all = False
+
+	while True:
+		improved = False
+		for i in range(1, n - 2):
+			if dont_look[tour[i]] and not check_all:
+				continue
+			# tour[i - 1] is never moved by reversals of tour[i..j]
+			a = tour[i - 1]
+			row_a = dist[a]
+			found = False
+			for j in range(i + 1, n - 1):
+				b = tour[i]
+				c = tour[j]
+				d = tour[j + 1]
+				# Swap edges: (i-1,i) + (j,j+1) → (i-1,j) + (i,j+1)
+				if row_a[c] + dist[b][d] < row_a[b] + dist[c][d]:
+					tour[i : j + 1] = tour[j : i - 1 : -1]
+					for node in tour[i - 1 : j + 2]:
+						dont_look[node] = False
+					improved = found = True
+			if not found:
+				dont_look[tour[i]] = True
+		if improved:
+			check_all = False
+		elif check_all:
+			break
+		else:
+			check_all = True
+	return tour
+
+
 class NearestNeighbor2Opt:
 	def __init__(self, main_city: str, selected_cities_list: list[str], distance_matrix: list[list[int]]):
 		# Filter out main city from selected_cities_list to avoid duplicates
@@ -8,26 +56,20 @@ class NearestNeighbor2Opt:
 
 	# Nearest Neighbor Heuristic
 	def nearest_neighbor(self) -> list[int]:
-		n = self.n
-		visited = [False] * n
+		# unvisited cities in ascending order, so min() breaks ties on the lowest index
+		unvisited = list(range(1, self.n))
 		tour = [0]  # always start at main city
-		visited[0] = True
 
 		current = 0
-		for _ in range(n - 1):
-			next_city = None
-			next_dist = float("inf")
+		while unvisited:
+			row = self.dist[current]
+			next_city = min(unvisited, key=row.__getitem__)
 
-			for j in range(n):
-				if not visited[j] and self.dist[current][j] < next_dist:
-					next_dist = self.dist[current][j]
-					next_city = j
-
-			if next_city is None:
+			if row[next_city] == float("inf"):
 				raise RuntimeError("No reachable next city. Check distance matrix")
 
 			tour.append(next_city)
-			visited[next_city] = True
+			unvisited.remove(next_city)
 			current = next_city
 
 		tour.append(0)  # return to start
@@ -42,27 +84,7 @@ class NearestNeighbor2Opt:
 
 	# 2-Opt Improvement
 	def two_opt(self, tour: list[int]) -> list[int]:
-		improved = True
-		n = len(tour)
-
-		while improved:
-			improved = False
-			for i in range(1, n - 2):
-				for j in range(i + 1, n - 1):
-					# Swap edges: (i-1,i) + (j,j+1) → (i-1,j) + (i,j+1)
-					old = (
-						self.dist[tour[i - 1]][tour[i]]
-						+ self.dist[tour[j]][tour[j + 1]]
-					)
-					new = (
-						self.dist[tour[i - 1]][tour[j]]
-						+ self.dist[tour[i]][tour[j + 1]]
-					)
-
-					if new < old:
-						tour[i : j + 1] = reversed(tour[i : j + 1])
-						improved = True
-		return tour
+		return _two_opt(tour, self.dist)
 
 	def start(self) -> tuple[int, list[str]]:
 		nn_tour = self.nearest_neighbor()
@@ -3,69 +3,19 @@ Unit tests for Traveling Salesman Problem algorithms and Game class.
 Uses pytest for testing framework.
 """
 
+import random
+
 import pytest
 from traveling_salesman.brute_force import BruteForce
+from traveling_salesman.game import run_held_karp, run_nn_2opt
 from traveling_salesman.held_karp import HeldKarpDP
 from traveling_salesman.nn_2opt import NearestNeighbor2Opt
-from traveling_salesman.game import Game
-
-
-# Test fixtures for distance matrices
-@pytest.fixture
-def simple_distance_matrix():
-	"""Simple 4-city distance matrix for testing."""
-	# Cities: A, B, C, D
-	# A-B: 10, A-C: 15, A-D: 20
-	# B-C: 35, B-D: 25
-	# C-D: 30
-	return [
-		[0, 10, 15, 20],  # A
-		[10, 0, 35, 25],  # B
-		[15, 35, 0, 30],  # C
-		[20, 25, 30, 0]   # D
-	]
-
-
-@pytest.fixture
-def symmetric_distance_matrix():
-	"""Symmetric 5-city distance matrix."""
-	# Cities: A, B, C, D, E
-	return [
-		[0, 10, 20, 30, 40],   # A
-		[10, 0, 15, 25, 35],   # B
-		[20, 15, 0, 12, 22],   # C
-		[30, 25, 12, 0, 18],   # D
-		[40, 35, 22, 18, 0]    # E
-	]
-
-
-@pytest.fixture
-def triangle_inequality_matrix():
-	"""Distance matrix that satisfies triangle inequality."""
-	# Cities: A, B, C
-	return [
-		[0, 5, 8],   # A
-		[5, 0, 6],   # B
-		[8, 6, 0]    # C
-	]
-
-
-@pytest.fixture
-def all_cities_simple():
-	"""List of cities for simple matrix."""
-	return ['A', 'B', 'C', 'D']
 
 
-@pytest.fixture
-def all_cities_symmetric():
-	"""List of cities for symmetric matrix."""
-	return ['A', 'B', 'C', 'D', 'E']
-
-
-@pytest.fixture
-def all_cities_triangle():
-	"""List of cities for triangle matrix."""
-	return ['A', 'B', 'C']
+def _submatrix(full: list[list[int]], all_cities: list[str], order: list[str]) -> list[list[int]]:
+	"""Rows and columns of `full` for the cities in `order` (NearestNeighbor2Opt's local indices)."""
+	indices = [all_cities.index(city) for city in order]
+	return [[full[i][j] for j in indices] for i in indices]
 
 
 # ==================== Brute Force Algorithm Tests ====================
@@ -143,9 +93,7 @@ class TestBruteForce:
 		distance, path = bf.start()
 		
 		# Check all selected cities appear exactly once in the middle
-		visited = path[1:-1]
-		assert len(visited) == len(selected_cities)
-		assert set(visited) == set(selected_cities)
+		assert sorted(path[1:-1]) == sorted(selected_cities)
 
 
 # ==================== Held-Karp Algorithm Tests ====================
@@ -232,12 +180,7 @@ class TestNearestNeighbor2Opt:
 		
 		# Create submatrix for NN2Opt (ordered_city_list = [A, B, C])
 		# Matrix indices: 0=A, 1=B, 2=C
-		# Get distances from simple_distance_matrix: A=0, B=1, C=2
-		nn_matrix = [
-			[simple_distance_matrix[0][0], simple_distance_matrix[0][1], simple_distance_matrix[0][2]],  # A to A, B, C
-			[simple_distance_matrix[1][0], simple_distance_matrix[1][1], simple_distance_matrix[1][2]],  # B to A, B, C
-			[simple_distance_matrix[2][0], simple_distance_matrix[2][1], simple_distance_matrix[2][2]]   # C to A, B, C
-		]
+		nn_matrix = _submatrix(simple_distance_matrix, all_cities_simple, [main_city] + selected_cities)
 		
 		nn = NearestNeighbor2Opt(main_city, selected_cities, nn_matrix)
 		distance, path = nn.start()
@@ -251,10 +194,7 @@ class TestNearestNeighbor2Opt:
 		main_city = 'A'
 		selected_cities = ['B']
 		
-		nn_matrix = [
-			[0, 10],
-			[10, 0]
-		]
+		nn_matrix = _submatrix(simple_distance_matrix, all_cities_simple, [main_city] + selected_cities)
 		
 		nn = NearestNeighbor2Opt(main_city, selected_cities, nn_matrix)
 		distance, path = nn.start()
@@ -268,11 +208,8 @@ class TestNearestNeighbor2Opt:
 		main_city = 'A'
 		selected_cities = ['A', 'B', 'C']
 		
-		nn_matrix = [
-			[0, 10, 15],
-			[10, 0, 35],
-			[15, 35, 0]
-		]
+		# Submatrix for [A, B, C]
+		nn_matrix = _submatrix(simple_distance_matrix, all_cities_simple, ['A', 'B', 'C'])
 		
 		nn = NearestNeighbor2Opt(main_city, selected_cities, nn_matrix)
 		
@@ -286,15 +223,8 @@ class TestNearestNeighbor2Opt:
 		selected_cities = ['A', 'B', 'D']
 		
 		# Create submatrix for [C, A, B, D]
-		# Global indices: C=2, A=0, B=1, D=3
 		# Local indices: 0=C, 1=A, 2=B, 3=D
-		global_indices = {'C': 2, 'A': 0, 'B': 1, 'D': 3}
-		ordered_list = [main_city] + selected_cities  # [C, A, B, D]
-		
-		nn_matrix = [[0] * 4 for _ in range(4)]
-		for i, city_i in enumerate(ordered_list):
-			for j, city_j in enumerate(ordered_list):
-				nn_matrix[i][j] = symmetric_distance_matrix[global_indices[city_i]][global_indices[city_j]]
+		nn_matrix = _submatrix(symmetric_distance_matrix, all_cities_symmetric, [main_city] + selected_cities)
 		
 		nn = NearestNeighbor2Opt(main_city, selected_cities, nn_matrix)
 		distance, path = nn.start()
@@ -329,6 +259,27 @@ class TestNearestNeighbor2Opt:
 		assert path[0] == main_city
 		assert path[-1] == main_city
 
+	
+	@pytest.mark.parametrize("seed", range(40))
+	def test_nn_2opt_leaves_no_improving_move(self, seed):
+		"""Test that the 2-opt tour is 2-opt optimal on random symmetric matrices of 6-15 cities."""
+		rng = random.Random(seed)
+		n = rng.choice([6, 8, 10, 15])
+		matrix = [[0] * n for _ in range(n)]
+		for i in range(n):
+			for j in range(i + 1, n):
+				matrix[i][j] = matrix[j][i] = rng.randint(50, 100)
+		cities = [str(k) for k in range(n)]
+		
+		nn = NearestNeighbor2Opt(cities[0], cities[1:], matrix)
+		tour = nn.two_opt(nn.nearest_neighbor())
+		
+		# No reversal of tour[i..j] may still shorten the tour
+		for i in range(1, n - 1):
+			for j in range(i + 1, n):
+				gain = (matrix[tour[i - 1]][tour[i]] + matrix[tour[j]][tour[j + 1]]
+						- matrix[tour[i - 1]][tour[j]] - matrix[tour[i]][tour[j + 1]])
+				assert gain <= 0
 
 # ==================== Algorithm Comparison Tests ====================
 
@@ -351,12 +302,7 @@ class TestAlgorithmComparison:
 		hk_distance, hk_path = hk.start()
 		
 		# NN 2-Opt (needs submatrix for ordered_city_list = [A, B, C])
-		# Global: A=0, B=1, C=2
-		nn_matrix = [
-			[simple_distance_matrix[0][0], simple_distance_matrix[0][1], simple_distance_matrix[0][2]],  # A
-			[simple_distance_matrix[1][0], simple_distance_matrix[1][1], simple_distance_matrix[1][2]],  # B
-			[simple_distance_matrix[2][0], simple_distance_matrix[2][1], simple_distance_matrix[2][2]]   # C
-		]
+		nn_matrix = _submatrix(simple_distance_matrix, all_cities_simple, [main_city] + selected_cities)
 		nn = NearestNeighbor2Opt(main_city, selected_cities, nn_matrix)
 		nn_distance, nn_path = nn.start()
 		
@@ -371,26 +317,51 @@ class TestAlgorithmComparison:
 		# NN 2-Opt should be >= optimal (heuristic)
 		assert nn_distance >= bf_distance
 	
-	def test_algorithms_path_format(self, symmetric_distance_matrix, all_cities_symmetric):
-		"""Test that all algorithms produce paths in the same format."""
-		main_city = 'A'
-		main_city_index = 0
-		selected_cities = ['B', 'C']
+	@pytest.mark.parametrize("seed", range(25))
+	def test_random_symmetric_matrices(self, seed):
+		"""Test the algorithms agree on random symmetric matrices of 2-7 cities."""
+		rng = random.Random(seed)
+		n = rng.randint(2, 7)
+		matrix = [[0] * n for _ in range(n)]
+		for i in range(n):
+			for j in range(i + 1, n):
+				matrix[i][j] = matrix[j][i] = rng.randint(1, 99)
+		cities = list("ABCDEFG"[:n])
+		
+		bf_distance, _ = BruteForce('A', 0, cities[1:], matrix, cities).start()
+		hk_distance, _ = HeldKarpDP('A', cities, matrix, cities[1:]).start()
+		nn_distance, _ = NearestNeighbor2Opt('A', cities[1:], matrix).start()
+		
+		# Both exact algorithms find the optimum; the heuristic never beats it
+		assert bf_distance == hk_distance
+		assert nn_distance >= bf_distance
+	
+	@pytest.mark.parametrize("seed", range(25))
+	def test_random_asymmetric_matrices(self, seed):
+		"""Test the exact algorithms agree when a tour and its reverse cost differently."""
+		rng = random.Random(seed)
+		n = rng.randint(2, 7)
+		matrix = [[0 if i == j else rng.randint(1, 99) for j in range(n)] for i in range(n)]
+		cities = list("ABCDEFG"[:n])
 		
-		# Brute Force
-		bf = BruteForce(main_city, main_city_index, selected_cities,
-		                symmetric_distance_matrix, all_cities_symmetric)
-		bf_distance, bf_path = bf.start()
+		bf_distance, bf_path = BruteForce('A', 0, cities[1:], matrix, cities).start()
+		hk_distance, _ = HeldKarpDP('A', cities, matrix, cities[1:]).start()
 		
-		# Held-Karp
-		hk = HeldKarpDP(main_city, all_cities_symmetric, symmetric_distance_matrix, selected_cities)
-		hk_distance, hk_path = hk.start()
+		assert bf_distance == hk_distance
+		assert sum(matrix[cities.index(a)][cities.index(b)] for a, b in zip(bf_path, bf_path[1:])) == bf_distance
+	
+	@pytest.mark.parametrize("make_solver", [
+		pytest.param(lambda matrix, cities: BruteForce('A', 0, ['B', 'C'], matrix, cities), id="brute_force"),
+		pytest.param(lambda matrix, cities: HeldKarpDP('A', cities, matrix, ['B', 'C']), id="held_karp"),
+	])
+	def test_algorithms_path_format(self, make_solver, symmetric_distance_matrix, all_cities_symmetric):
+		"""Test that Brute Force and Held-Karp paths use the same format."""
+		_, path = make_solver(symmetric_distance_matrix, all_cities_symmetric).start()
 		
-		# All paths should start and end with main city
-		assert bf_path[0] == main_city
-		assert bf_path[-1] == main_city
-		assert hk_path[0] == main_city
-		assert hk_path[-1] == main_city
+		# Main city at both ends, each selected city once in between
+		assert path[0] == 'A'
+		assert path[-1] == 'A'
+		assert sorted(path[1:-1]) == ['B', 'C']
 
 
 # ==================== Game Class Tests ====================
@@ -398,44 +369,34 @@ class TestAlgorithmComparison:
 class TestGame:
 	"""Test suite for Game class."""
 	
-	def test_game_initialization(self):
+	def test_game_initialization(self, shared_game):
 		"""Test that Game initializes correctly."""
-		game = Game()
-		
-		assert len(game.cities) == 10
-		assert game.cities == ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
-		assert game.main_city in game.cities
-		assert len(game.distance_matrix) == 10
-		assert len(game.distance_matrix[0]) == 10
-		assert game.player_selected_cities == []
-	
-	def test_game_distance_matrix_symmetric(self):
+		assert len(shared_game.cities) == 10
+		assert shared_game.cities == ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
+		assert shared_game.main_city in shared_game.cities
+		assert len(shared_game.distance_matrix) == 10
+		assert len(shared_game.distance_matrix[0]) == 10
+		assert shared_game.player_selected_cities == []
+	
+	def test_game_distance_matrix_symmetric(self, shared_game):
 		"""Test that distance matrix is symmetric."""
-		game = Game()
-		
-		for i in range(len(game.cities)):
-			for j in range(len(game.cities)):
-				assert game.distance_matrix[i][j] == game.distance_matrix[j][i]
+		matrix = shared_game.distance_matrix
+		# one comparison against the transpose instead of an assert per cell
+		assert matrix == [list(column) for column in zip(*matrix)]
 	
-	def test_game_distance_matrix_diagonal_zero(self):
+	def test_game_distance_matrix_diagonal_zero(self, shared_game):
 		"""Test that distance matrix diagonal is zero."""
-		game = Game()
-		
-		for i in range(len(game.cities)):
-			assert game.distance_matrix[i][i] == 0
+		matrix = shared_game.distance_matrix
+		assert [matrix[i][i] for i in range(len(matrix))] == [0] * len(shared_game.cities)
 	
-	def test_game_distance_matrix_values(self):
+	def test_game_distance_matrix_values(self, shared_game):
 		"""Test that distance matrix values are in expected range."""
-		game = Game()
-		
-		for i in range(len(game.cities)):
-			for j in range(len(game.cities)):
-				if i != j:
-					assert 50 <= game.distance_matrix[i][j] <= 100
+		matrix = shared_game.distance_matrix
+		off_diagonal = [matrix[i][j] for i in range(len(matrix)) for j in range(len(matrix)) if i != j]
+		assert 50 <= min(off_diagonal) and max(off_diagonal) <= 100
 	
-	def test_reset_game(self):
+	def test_reset_game(self, game):
 		"""Test that reset_game generates new distance matrix and main city."""
-		game = Game()
 		original_main_city = game.main_city
 		original_matrix = [row[:] for row in game.distance_matrix]  # Deep copy
 		
@@ -449,18 +410,16 @@ class TestGame:
 		assert len(game.distance_matrix) == 10
 		assert len(game.distance_matrix[0]) == 10
 	
-	def test_reset_game_clears_player_selection(self):
+	def test_reset_game_clears_player_selection(self, game):
 		"""Test that reset_game clears player selected cities."""
-		game = Game()
 		game.player_selected_cities = ['A', 'B', 'C']
 		
 		game.reset_game()
 		
 		assert game.player_selected_cities == []
 	
-	def test_win_or_lose_correct_guess(self):
+	def test_win_or_lose_correct_guess(self, game):
 		"""Test win_or_lose with correct player guess."""
-		game = Game()
 		correct_path = ['A', 'B', 'C', 'A']
 		player_guess = ['A', 'B', 'C', 'A']
 		
@@ -468,9 +427,8 @@ class TestGame:
 		
 		assert game.is_won is True
 	
-	def test_win_or_lose_incorrect_guess(self):
+	def test_win_or_lose_incorrect_guess(self, game):
 		"""Test win_or_lose with incorrect player guess."""
-		game = Game()
 		correct_path = ['A', 'B', 'C', 'A']
 		player_guess = ['A', 'C', 'B', 'A']
 		
@@ -478,9 +436,8 @@ class TestGame:
 		
 		assert game.is_won is False
 	
-	def test_win_or_lose_different_length(self):
+	def test_win_or_lose_different_length(self, game):
 		"""Test win_or_lose with paths of different lengths."""
-		game = Game()
 		correct_path = ['A', 'B', 'C', 'A']
 		player_guess = ['A', 'B', 'A']
 		
@@ -488,13 +445,12 @@ class TestGame:
 		
 		assert game.is_won is False
 	
-	def test_run_algorithms_returns_tuple(self):
+	def test_run_algorithms_returns_tuple(self, game):
 		"""Test that run_algorithms returns a tuple of (bool, list)."""
-		game = Game()
 		game.player_selected_cities = ['B', 'C']
 		player_guess = ['A', 'B', 'C', 'A']
 		
-		# This test might be slow due to multiprocessing, but it's important
+		# The algorithms run in-process, so this is as fast as the unit tests above
 		result = game.run_algorithms(player_guess)
 		
 		assert isinstance(result, tuple)
@@ -502,9 +458,34 @@ class TestGame:
 		assert isinstance(result[0], bool)
 		assert isinstance(result[1], list)
 	
-	def test_run_algorithms_stores_times(self):
+	@pytest.mark.parametrize("main_city, selected_cities", [
+		('A', ['D', 'H', 'J']),
+		('E', ['B', 'J', 'C', 'G']),
+	])
+	def test_run_nn_2opt_non_prefix_selection(self, game, main_city, selected_cities):
+		"""Test that NN 2-Opt costs selections that are not the first cities of the matrix correctly."""
+		distance, path, _ = run_nn_2opt(main_city, selected_cities, game.distance_matrix, game.cities)
+		hk_distance, _, _ = run_held_karp(main_city, game.cities, game.distance_matrix, selected_cities)
+		
+		# The reported cost is the cost of the returned path on the full matrix
+		index = game.cities.index
+		assert distance == sum(game.distance_matrix[index(a)][index(b)] for a, b in zip(path, path[1:]))
+		assert sorted(path[1:-1]) == sorted(selected_cities)
+		assert distance >= hk_distance
+	
+	def test_run_algorithms_best_path_non_prefix_selection(self, game):
+		"""Test that the best path's cost is the optimum for a non-prefix selection."""
+		game.main_city = 'A'
+		game.player_selected_cities = ['D', 'H', 'J']
+		hk_distance, _, _ = run_held_karp('A', game.cities, game.distance_matrix, ['D', 'H', 'J'])
+		
+		_, best_path = game.run_algorithms(['A', 'D', 'H', 'J', 'A'])
+		
+		index = game.cities.index
+		assert sum(game.distance_matrix[index(a)][index(b)] for a, b in zip(best_path, best_path[1:])) == hk_distance
+	
+	def test_run_algorithms_stores_times(self, game):
 		"""Test that run_algorithms stores algorithm execution times."""
-		game = Game()
 		game.player_selected_cities = ['B', 'C']
 		player_guess = ['A', 'B', 'C', 'A']
 		
@@ -523,45 +504,18 @@ class TestGame:
 class TestEdgeCases:
 	"""Test edge cases and error handling."""
 	
-	def test_brute_force_single_city(self, simple_distance_matrix, all_cities_simple):
-		"""Test brute force with no selected cities (only main city)."""
-		main_city = 'A'
-		main_city_index = 0
-		selected_cities = []
-		
-		bf = BruteForce(main_city, main_city_index, selected_cities,
-		                simple_distance_matrix, all_cities_simple)
-		distance, path = bf.start()
+	@pytest.mark.parametrize("make_solver", [
+		pytest.param(lambda matrix, cities: BruteForce('A', 0, [], matrix, cities), id="brute_force"),
+		pytest.param(lambda matrix, cities: HeldKarpDP('A', cities, matrix, []), id="held_karp"),
+		pytest.param(lambda matrix, cities: NearestNeighbor2Opt('A', [], [[0]]), id="nn_2opt"),
+	])
+	def test_single_city(self, make_solver, simple_distance_matrix, all_cities_simple):
+		"""Test each algorithm with no selected cities (only main city)."""
+		distance, path = make_solver(simple_distance_matrix, all_cities_simple).start()
 		
 		# Should just be A -> A = 0
 		assert distance == 0
 		assert path == ['A', 'A']
-	
-	def test_held_karp_single_city(self, simple_distance_matrix, all_cities_simple):
-		"""Test Held-Karp with no selected cities."""
-		main_city = 'A'
-		selected_cities = []
-		
-		hk = HeldKarpDP(main_city, all_cities_simple, simple_distance_matrix, selected_cities)
-		distance, path = hk.start()
-		
-		# Should return main city to itself with distance 0
-		assert distance == 0
-		assert path[0] == main_city
-		assert path[-1] == main_city
-		assert len(path) == 2
-	
-	def test_nn_2opt_single_city(self):
-		"""Test NN 2-Opt with no selected cities."""
-		main_city = 'A'
-		selected_cities = []
-		
-		nn_matrix = [[0]]
-		nn = NearestNeighbor2Opt(main_city, selected_cities, nn_matrix)
-		distance, path = nn.start()
-		
-		assert distance == 0
-		assert path == ['A', 'A']
 
 
 # ==================== Integration Tests ====================
@@ -569,10 +523,8 @@ class TestEdgeCases:
 class TestIntegration:
 	"""Integration tests for the full system."""
 	
-	def test_full_game_flow(self):
+	def test_full_game_flow(self, game):
 		"""Test a complete game flow."""
-		game = Game()
-		
 		# Select some cities
 		game.player_selected_cities = ['B', 'C', 'D']
 		
@@ -593,9 +545,8 @@ class TestIntegration:
 		assert hasattr(game, 'algorithm_times')
 		assert len(game.algorithm_times) == 3
 	
-	def test_multiple_rounds(self):
+	def test_multiple_rounds(self, game):
 		"""Test multiple game rounds with reset."""
-		game = Game()
 		round1_main = game.main_city
 		
 		game.player_selected_cities = ['B', 'C']
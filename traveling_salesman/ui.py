@@ -1,144 +1,112 @@
 import customtkinter as ctk
-import math
-import random
+import threading
 import time
 from typing import Optional
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+import numpy as np
 from .game import Game
 from .data import init_database, create_round, save_algorithm_times, save_player_win
 
-def spring_layout(cities: list[str], distance_matrix: list[list[int]], iterations: int = 100) -> dict[str, tuple[float, float]]:
+def preload_matplotlib() -> None:
+	# matplotlib takes most of the start-up time to import, so draw_ui runs this
+	# in a background thread while the player types their name; the imports
+	# where it is used then find the modules already loaded (or wait for them)
+	import matplotlib.backends.backend_tkagg
+	import matplotlib.collections
+	import matplotlib.figure
+
+def spring_iterate(pos: np.ndarray, desired: np.ndarray, iterations: int, dt: float, damping: float) -> None:
+	# Move the (n, 2) positions in place towards the desired pairwise distances
+	n = len(pos)
+	diagonal = np.eye(n, dtype=bool)
+	
+	for iteration in range(iterations):
+		# Current distance between nodes, from |a|^2 + |b|^2 - 2a.b so no
+		# (n, n, 2) difference array is needed
+		sq_norms = (pos * pos).sum(axis=1)
+		sq = sq_norms[:, None] + sq_norms[None, :] - 2.0 * (pos @ pos.T)
+		current = np.sqrt(np.maximum(sq, 1e-6))
+		
+		# Spring force (proportional to difference) along each pair's direction:
+		# node i is pulled by sum_j w_ij * (pos_j - pos_i) = (W @ pos)_i - rowsum(W)_i * pos_i
+		weights = (current - desired) * 0.1 / current
+		weights[diagonal] = 0.0
+		forces = weights @ pos - weights.sum(axis=1)[:, None] * pos
+		
+		# Update with damping, keeping within bounds
+		pos += forces * dt * damping
+		np.clip(pos, 0.1, 0.9, out=pos)
+
+def spring_layout(cities: list[str], distance_matrix: list[list[int]], iterations: int = 30) -> list[list[float]]:
+	# Returns the [x, y] position of each city, in the order of `cities`
 	n = len(cities)
 	
-	all_distances = []
-	for i in range(n):
-		for j in range(i + 1, n):
-			all_distances.append(distance_matrix[i][j])
-	min_dist = min(all_distances) if all_distances else 50
-	max_dist = max(all_distances) if all_distances else 100
+	# The diagonal is zero, so the largest entry is the largest distance
+	distances = np.asarray(distance_matrix, dtype=np.float64)
+	max_dist = distances.max() if n > 1 else 100
 	
 	canvas_range = 0.8
 	scale = canvas_range / max_dist if max_dist > 0 else 0.01
 	
-	# Initialize positions randomly or in a circle
-	positions = {}
-	center_x, center_y = 0.5, 0.5
-	for i, city in enumerate(cities):
-		# Start with circular layout as initial guess
-		angle = 2 * math.pi * i / n - math.pi / 2
-		radius_init = 0.3
-		positions[city] = (
-			center_x + radius_init * math.cos(angle) + random.uniform(-0.1, 0.1),
-			center_y + radius_init * math.sin(angle) + random.uniform(-0.1, 0.1)
-		)
+	# Desired distances (normalized from distance matrix)
+	desired = distances * scale
+	
+	# Initialize positions with classical MDS: the top two eigenvectors of the
+	# double-centred squared distances already place the cities close to their
+	# desired distances, so far fewer spring iterations are needed than from a circle
+	centering = np.eye(n) - 1.0 / n
+	gram = -0.5 * centering @ (desired * desired) @ centering
+	eigenvalues, eigenvectors = np.linalg.eigh(gram)
+	dims = min(n, 2)
+	pos = np.full((n, 2), 0.5)
+	pos[:, :dims] += eigenvectors[:, -dims:] * np.sqrt(np.maximum(eigenvalues[-dims:], 0.0))
+	np.clip(pos, 0.1, 0.9, out=pos)
 	
 	# Spring layout iterations
 	dt = 0.1  # Time step
 	damping = 0.8  # Damping factor
 	
-	for iteration in range(iterations):
-		forces = {city: [0.0, 0.0] for city in cities}
-		
-		for i in range(n):
-			for j in range(i + 1, n):
-				city1 = cities[i]
-				city2 = cities[j]
-				
-				x1, y1 = positions[city1]
-				x2, y2 = positions[city2]
-				
-				# Current distance between nodes
-				dx = x2 - x1
-				dy = y2 - y1
-				current_dist = math.sqrt(dx*dx + dy*dy) if (dx*dx + dy*dy) > 0 else 0.001
-				
-				# Desired distance (normalized from distance matrix)
-				desired_dist = distance_matrix[i][j] * scale
-				
-				# Spring force (proportional to difference)
-				force_magnitude = (current_dist - desired_dist) * 0.1
-				
-				# Direction vector
-				force_x = (dx / current_dist) * force_magnitude
-				force_y = (dy / current_dist) * force_magnitude
-				
-				# Apply forces (opposite directions)
-				forces[city1][0] += force_x
-				forces[city1][1] += force_y
-				forces[city2][0] -= force_x
-				forces[city2][1] -= force_y
-		
-		# Update positions based on forces
-		for city in cities:
-			fx, fy = forces[city]
-			x, y = positions[city]
-			
-			# Update with damping
-			x += fx * dt * damping
-			y += fy * dt * damping
-			
-			# Keep within bounds
-			x = max(0.1, min(0.9, x))
-			y = max(0.1, min(0.9, y))
-			
-			positions[city] = (x, y)
+	spring_iterate(pos, desired, iterations, dt, damping)
 	
-	return positions
+	return pos.tolist()
 
 def draw_graph(ax, cities: list[str], distance_matrix: list[list[int]], main_city: str, 
 			   bg_color: str, card_bg: str, accent: str, accent_hover: str, 
-			   text_color: str, text_secondary: str) -> None:
-	n = len(cities)
+			   text_color: str, text_secondary: str) -> dict:
+	# Creates the graph's artists once and returns their handles; later rounds
+	# move them with update_graph instead of clearing and rebuilding the axes
+	from matplotlib.collections import EllipseCollection, LineCollection
 	
-	# Calculate node positions using spring layout (edge lengths based on distances)
-	node_positions = spring_layout(cities, distance_matrix, iterations=150)
+	n = len(cities)
+	pairs = [(i, j) for i in range(n) for j in range(i + 1, n)]
 	
 	# Uniform edge thickness (not based on distance)
 	edge_linewidth = 1.5
 	
-	# Draw edges (connections between all cities)
-	for i in range(n):
-		for j in range(i + 1, n):
-			city1 = cities[i]
-			city2 = cities[j]
-			x1, y1 = node_positions[city1]
-			x2, y2 = node_positions[city2]
-			distance = distance_matrix[i][j]
-			
-			ax.plot([x1, x2], [y1, y2], 'o-', color=text_secondary, linewidth=edge_linewidth, 
-				   markersize=0, alpha=0.5, zorder=1)
-			
-			# Draw distance label at midpoint
-			mid_x = (x1 + x2) / 2
-			mid_y = (y1 + y2) / 2
-			ax.text(mid_x, mid_y, str(distance), fontsize=10, 
-				   ha='center', va='center', 
-				   bbox=dict(boxstyle='round,pad=0.4', facecolor=card_bg,
-							edgecolor=text_secondary, alpha=0.9, linewidth=1),
-				   color=text_color, zorder=3)
-	
-	# Draw nodes
-	for city in cities:
-		x, y = node_positions[city]
-		
-		if city == main_city:
-			node_color = accent
-			edge_color = accent_hover
-			edge_width = 3
-		else:
-			node_color = text_secondary
-			edge_color = card_bg
-			edge_width = 2
-		
-		circle = plt.Circle((x, y), 0.045, color=node_color, 
-						   edgecolor=edge_color, linewidth=edge_width, zorder=4)
-		ax.add_patch(circle)
-		
-		# Draw city label inside the node
-		ax.text(x, y, city, fontsize=14, fontweight='bold',
+	# Edges (connections between all cities) as one collection
+	edges = LineCollection([], colors=text_secondary, linewidths=edge_linewidth, alpha=0.5, zorder=1)
+	ax.add_collection(edges)
+	
+	# Distance label at each edge's midpoint
+	distance_labels = [
+		ax.text(0, 0, "", fontsize=10, ha='center', va='center',
+			   bbox=dict(boxstyle='round,pad=0.4', facecolor=card_bg,
+						edgecolor=text_secondary, alpha=0.9, linewidth=1),
+			   color=text_color, zorder=3)
+		for _ in pairs
+	]
+	
+	# Nodes as one collection of circles sized in data units. The outline
+	# matches the fill, as it did with the former per-node Circle(color=...) patches.
+	nodes = EllipseCollection(0.09, 0.09, 0.0, units='xy', offsets=np.zeros((n, 2)),
+							  offset_transform=ax.transData, zorder=4)
+	ax.add_collection(nodes)
+	
+	# City label inside each node
+	city_labels = [
+		ax.text(0, 0, city, fontsize=14, fontweight='bold',
 			   ha='center', va='center', color=text_color, zorder=5)
+		for city in cities
+	]
 	
 	# Set axis properties
 	ax.set_xlim(0, 1)
@@ -146,6 +114,43 @@ def draw_graph(ax, cities: list[str], distance_matrix: list[list[int]], main_cit
 	ax.set_aspect('equal')
 	ax.axis('off')
 	ax.set_title('City Graph with Distances', fontsize=14, color=text_color, pad=10)
+	
+	handles = {
+		"pairs": pairs,
+		"edges": edges,
+		"distance_labels": distance_labels,
+		"nodes": nodes,
+		"city_labels": city_labels,
+		"accent": accent,
+		"text_secondary": text_secondary,
+	}
+	update_graph(handles, cities, distance_matrix, main_city)
+	return handles
+
+def update_graph(handles: dict, cities: list[str], distance_matrix: list[list[int]], main_city: str) -> None:
+	# Moves the artists made by draw_graph to a new distance matrix and main city
+	
+	# Calculate node positions using spring layout (edge lengths based on distances)
+	node_positions = spring_layout(cities, distance_matrix, iterations=30)
+	
+	segments = [(node_positions[i], node_positions[j]) for i, j in handles["pairs"]]
+	handles["edges"].set_segments(segments)
+	
+	for label, (i, j), ((x1, y1), (x2, y2)) in zip(handles["distance_labels"], handles["pairs"], segments):
+		label.set_position(((x1 + x2) / 2, (y1 + y2) / 2))
+		label.set_text(str(distance_matrix[i][j]))
+	
+	# The main city is highlighted
+	accent, text_secondary = handles["accent"], handles["text_secondary"]
+	node_colors = [accent if city == main_city else text_secondary for city in cities]
+	nodes = handles["nodes"]
+	nodes.set_offsets(node_positions)
+	nodes.set_facecolor(node_colors)
+	nodes.set_edgecolor(node_colors)
+	nodes.set_linewidth([3 if city == main_city else 2 for city in cities])
+	
+	for label, position in zip(handles["city_labels"], node_positions):
+		label.set_position(position)
 
 def get_player_name() -> Optional[str]:
 	# Create a temporary root window for the popup
@@ -209,7 +214,29 @@ def get_player_name() -> Optional[str]:
 	return player_name[0]
 
 
+def create_city_checkboxes(rows: list[ctk.CTkFrame], cities: list[str], main_city: str, 
+						   card_bg: str, text_secondary: str) -> dict[str, ctk.CTkCheckBox]:
+	# One checkbox per city, split evenly across the rows; the main city's is disabled
+	per_row = -(-len(cities) // len(rows))  # ceiling division
+	checkboxes: dict[str, ctk.CTkCheckBox] = {}
+	for i, c in enumerate(cities):
+		row = rows[i // per_row]
+		# Disable and style the main city checkbox
+		if c == main_city:
+			# Visual cue: grayed out text and checkbox
+			btn = ctk.CTkCheckBox(row, text=c, state="disabled",
+								  text_color=text_secondary, fg_color=card_bg, 
+								  hover_color=card_bg, checkmark_color=text_secondary)
+		else:
+			btn = ctk.CTkCheckBox(row, text=c)
+		btn.pack(side="left", padx=3)
+		checkboxes[c] = btn
+	return checkboxes
+
+
 def draw_ui(game: Game) -> None:
+	threading.Thread(target=preload_matplotlib, daemon=True).start()
+	
 	# Initialize database
 	init_database()
 	
@@ -219,12 +246,15 @@ def draw_ui(game: Game) -> None:
 		# User cancelled, exit
 		return
 	
+	from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+	from matplotlib.figure import Figure
+	
 	window = ctk.CTk()
 	window.title("Traveling Salesman Problem")
 	window.geometry("1280x720")
-	
-	window.state('zoomed')
-	window.attributes('-fullscreen', True)
+	# Keep the window hidden while it is built, so Tk lays it out once when
+	# it is shown instead of after every pack()
+	window.withdraw()
 
 	bg_dark = "#0a0e27"
 	card_bg = "#151932"
@@ -234,6 +264,10 @@ def draw_ui(game: Game) -> None:
 	text_secondary = "#94a3b8"
 
 	window.configure(fg_color=bg_dark)
+
+	# Fonts are created once for this window and shared by its widgets
+	font_title = ctk.CTkFont(family="SF Pro Display", size=20)
+	font_label = ctk.CTkFont(family="SF Pro Display", size=16)
 	
 	# Track current round ID for database
 	current_round_id = [None]
@@ -259,7 +293,7 @@ def draw_ui(game: Game) -> None:
 	ax.set_facecolor(card_bg)
 	
 	# Draw the graph
-	draw_graph(ax, game.cities, game.distance_matrix, game.main_city, 
+	graph = draw_graph(ax, game.cities, game.distance_matrix, game.main_city, 
 			   bg_dark, card_bg, accent, accent_hover, text_primary, text_secondary)
 	
 	# Embed matplotlib figure in customtkinter
@@ -267,13 +301,13 @@ def draw_ui(game: Game) -> None:
 	canvas.draw()
 	canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
 
-	title = ctk.CTkLabel(right_frame, text="Traveling Salesman", font=("SF Pro Display", 20))
+	title = ctk.CTkLabel(right_frame, text="Traveling Salesman", font=font_title)
 	title.pack(pady=20)
 
-	main_city_label = ctk.CTkLabel(right_frame, text=f"Main city: {game.main_city}", font=("SF Pro Display", 16))
+	main_city_label = ctk.CTkLabel(right_frame, text=f"Main city: {game.main_city}", font=font_label)
 	main_city_label.pack(pady=10)
 
-	select_label = ctk.CTkLabel(right_frame, text="Select cities", font=("SF Pro Display", 16))
+	select_label = ctk.CTkLabel(right_frame, text="Select cities", font=font_label)
 	select_label.pack(pady=10)
 
 	# list of cities
@@ -285,36 +319,11 @@ def draw_ui(game: Game) -> None:
 	row2 = ctk.CTkFrame(city_frame, fg_color="transparent")
 	row2.pack(pady=(5, 10))
 
-	cities = "ABCDEFGHIJ"
-	
 	# Store checkbox references
-	checkbox_dict = {}
+	checkbox_dict = create_city_checkboxes([row1, row2], game.cities, game.main_city, card_bg, text_secondary)
+	checkbox_items = list(checkbox_dict.items())
 
-	for c in cities[:5]:
-		# Disable and style the main city checkbox
-		if c == game.main_city:
-			btn = ctk.CTkCheckBox(row1, text=c, state="disabled")
-			# Visual cue: grayed out text and checkbox
-			btn.configure(text_color=text_secondary, fg_color=card_bg, 
-						 hover_color=card_bg, checkmark_color=text_secondary)
-		else:
-			btn = ctk.CTkCheckBox(row1, text=c)
-		btn.pack(side="left", padx=3)
-		checkbox_dict[c] = btn
-
-	for c in cities[5:]:
-		# Disable and style the main city checkbox
-		if c == game.main_city:
-			btn = ctk.CTkCheckBox(row2, text=c, state="disabled")
-			# Visual cue: grayed out text and checkbox
-			btn.configure(text_color=text_secondary, fg_color=card_bg, 
-						 hover_color=card_bg, checkmark_color=text_secondary)
-		else:
-			btn = ctk.CTkCheckBox(row2, text=c)
-		btn.pack(side="left", padx=3)
-		checkbox_dict[c] = btn
-
-	guess_label = ctk.CTkLabel(right_frame, text="Guess path", font=("SF Pro Display", 16))
+	guess_label = ctk.CTkLabel(right_frame, text="Guess path", font=font_label)
 	guess_label.pack(pady=(20, 5))
 
 	guess_entry = ctk.CTkEntry(right_frame, width=200)
@@ -325,7 +334,7 @@ def draw_ui(game: Game) -> None:
 	logs_frame.pack(fill="both", expand=True, pady=(10, 0))
 	
 	# Logs title
-	ctk.CTkLabel(logs_frame, text="Algorithm running logs", font=("SF Pro Display", 16)).pack(pady=(10, 5))
+	ctk.CTkLabel(logs_frame, text="Algorithm running logs", font=font_label).pack(pady=(10, 5))
 	
 	# Scrollable text area for logs
 	logs_text = ctk.CTkTextbox(logs_frame, width=320, height=150, 
@@ -334,6 +343,9 @@ def draw_ui(game: Game) -> None:
 	logs_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 	
 	status_green = "#10b981"
+	# One tag per log colour, registered once and reused by every message
+	logs_text.tag_config("green", foreground=status_green)
+	logs_text.tag_config("secondary", foreground=text_secondary)
 
 	def show_validation_error():
 		popup = ctk.CTkToplevel(window)
@@ -353,19 +365,16 @@ def draw_ui(game: Game) -> None:
 		ctk.CTkLabel(
 			popup, 
 			text="Minimum cities 2 and maximum cities 7", 
-			font=("SF Pro Display", 16)
+			font=font_label
 		).pack(pady=30)
 		ctk.CTkButton(popup, text="OK", command=popup.destroy).pack(pady=10)
 
 	def on_check_button_click():
-		# Collect all selected cities from checkboxes
-		selected_cities = []
-		for city, checkbox in checkbox_dict.items():
-			if checkbox.get():  # get() returns True if checkbox is checked
-				selected_cities.append(city)
-		
-		# Remove main city if somehow included (shouldn't happen but safety check)
-		selected_cities = [city for city in selected_cities if city != game.main_city]
+		# Collect all selected cities from checkboxes in one pass
+		# get() returns 1 if the checkbox is checked; the main city is skipped
+		# in case it is somehow included (shouldn't happen but safety check)
+		main_city = game.main_city
+		selected_cities = [city for city, checkbox in checkbox_items if checkbox.get() and city != main_city]
 		
 		# Validate: minimum 2, maximum 7 cities
 		if len(selected_cities) < 2 or len(selected_cities) > 7:
@@ -395,40 +404,31 @@ def draw_ui(game: Game) -> None:
 		# Clear previous logs
 		logs_text.delete("1.0", "end")
 		
-		# Function to add log message
-		tag_counter = [0]
-		def add_log(message: str, color: str = text_primary):
-			# Get position before inserting
-			start_index = logs_text.index("end")
-			logs_text.insert("end", message + "\n")
-			# Get position after inserting (before the newline)
-			end_index = logs_text.index("end-1c")
-			
-			# Apply color tag if not default color
-			if color != text_primary:
-				tag_counter[0] += 1
-				tag_name = f"colored_{tag_counter[0]}"
-				# Apply tag to the inserted text
-				logs_text.tag_add(tag_name, start_index, end_index)
-				logs_text.tag_config(tag_name, foreground=color)
+		# Function to add log message (tag: "green", "secondary", or None for the default colour)
+		def add_log(message: str, tag: Optional[str] = None):
+			logs_text.insert("end", message + "\n", tag)
+		
+		# Show what has been logged so far in one repaint, not one per line
+		def flush_logs():
 			logs_text.see("end")
-			window.update()
+			window.update_idletasks()
 		
 		# Track algorithm execution with timing
-		add_log("Starting algorithms...", text_secondary)
-		total_start = time.time()
+		add_log("Starting algorithms...", "secondary")
 		
 		# Log each algorithm start
-		add_log("▶ Brute Force: Starting...", status_green)
-		add_log("▶ Held-Karp DP: Starting...", status_green)
-		add_log("▶ Nearest Neighbor 2-Opt: Starting...", status_green)
-		window.update()
+		add_log("▶ Brute Force: Starting...", "green")
+		add_log("▶ Held-Karp DP: Starting...", "green")
+		add_log("▶ Nearest Neighbor 2-Opt: Starting...", "green")
+		flush_logs()
 		
-		# Run algorithms with multiprocessing and compare results
+		# Run algorithms and compare results; the clock starts after the log
+		# repaint so only the algorithms are counted in the total
+		total_start = time.perf_counter()
 		is_won, best_path = game.run_algorithms(player_guess)
 		
 		# Get timing information from game object
-		total_time = time.time() - total_start
+		total_time = time.perf_counter() - total_start
 		
 		# Log completion with individual times
 		if hasattr(game, 'algorithm_times') and game.algorithm_times:
@@ -447,13 +447,14 @@ def draw_ui(game: Game) -> None:
 					return f"{t:.8f}s"
 			
 			# Display times with appropriate precision
-			add_log(f"✓ Brute Force: Finished in {format_time(bf_time)}", status_green)
-			add_log(f"✓ Held-Karp DP: Finished in {format_time(hk_time)}", status_green)
-			add_log(f"✓ Nearest Neighbor 2-Opt: Finished in {format_time(nn_time)}", status_green)
+			add_log(f"✓ Brute Force: Finished in {format_time(bf_time)}", "green")
+			add_log(f"✓ Held-Karp DP: Finished in {format_time(hk_time)}", "green")
+			add_log(f"✓ Nearest Neighbor 2-Opt: Finished in {format_time(nn_time)}", "green")
 		else:
-			add_log("✓ All algorithms finished", status_green)
+			add_log("✓ All algorithms finished", "green")
 		
-		add_log(f"\nTotal execution time: {total_time:.3f}s", text_secondary)
+		add_log(f"\nTotal execution time: {total_time:.3f}s", "secondary")
+		flush_logs()
 		
 		# Save algorithm times to database
 		if current_round_id[0] and hasattr(game, 'algorithm_times') and game.algorithm_times:
@@ -516,12 +517,12 @@ def draw_ui(game: Game) -> None:
 									  fg_color=card_bg, hover_color=card_bg, 
 									  checkmark_color=text_secondary)
 			
-			# Clear and redraw the graph
-			ax.clear()
-			ax.set_facecolor(card_bg)
-			draw_graph(ax, game.cities, game.distance_matrix, game.main_city, 
-					   bg_dark, card_bg, accent, accent_hover, text_primary, text_secondary)
-			canvas.draw()
+			# Move the existing graph artists to the new round's layout
+			update_graph(graph, game.cities, game.distance_matrix, game.main_city)
+			# Nearly every artist changes each round, so blitting would save
+			# little over a full render; schedule it for when Tk is idle so the
+			# result popup closes without waiting on the rasterization
+			canvas.draw_idle()
 		
 		# Show result popup with refresh callback
 		if is_won:
@@ -545,6 +546,12 @@ def draw_ui(game: Game) -> None:
 	)
 	exit_button.pack(side="left", padx=5)
 
+	# Everything is built: lay it out once, then show it full screen
+	window.update_idletasks()
+	window.deiconify()
+	window.state('zoomed')
+	window.attributes('-fullscreen', True)
+
 	window.mainloop()
 
 def show_win(parent_window, refresh_callback) -> None:
@@ -570,6 +577,10 @@ def show_win(parent_window, refresh_callback) -> None:
 	ctk.CTkButton(popup, text="OK", command=on_ok).pack(pady=10)
 
 def show_lose(parent_window, correct_path: str, refresh_callback) -> None:
+	# correct_path arrives already joined by the caller; build the label text
+	# before the popup so the Toplevel is realized without any formatting work
+	path_text = "Correct Path:\n" + correct_path
+
 	popup = ctk.CTkToplevel(parent_window)
 	popup.title("Result")
 	popup.geometry("300x180")
@@ -589,5 +600,5 @@ def show_lose(parent_window, correct_path: str, refresh_callback) -> None:
 		popup.destroy()
 
 	ctk.CTkLabel(popup, text="You lose!", font=("SF Pro Display", 18)).pack(pady=20)
-	ctk.CTkLabel(popup, text=f"Correct Path:\n{correct_path}", font=("Arial", 14)).pack(pady=10)
+	ctk.CTkLabel(popup, text=path_text, font=("Arial", 14)).pack(pady=10)
 	ctk.CTkButton(popup, text="OK", command=on_ok).pack(pady=10)